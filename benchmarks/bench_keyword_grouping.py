@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+关键词分组基准：比较二元组倒排索引与原先逐一调用 process.extract 的分组
+
+用法:
+    python benchmarks/bench_keyword_grouping.py [--sizes 1000 10000 100000] [--method fuzzy|tfidf] [--workers N]
+        [--legacy-max 1000]
+
+生成带单复数、连字符、词序和拼写变体的合成关键词；关键词数不超过 --legacy-max 时
+同时运行原分组方法并检查两者的分组结果是否一致
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from fuzzywuzzy import fuzz, process
+from modules.keyword_analyzer import KeywordAnalyzer
+
+WORDS = ("soil moisture remote sensing machine learning deep neural network climate change "
+         "drought model water quality land use cover carbon emission urban heat island "
+         "vegetation index precipitation temperature evapotranspiration groundwater river "
+         "basin flood risk assessment satellite image classification random forest support "
+         "vector regression time series analysis spatial pattern ecosystem service biomass "
+         "forest fire crop yield agriculture nitrogen phosphorus sediment erosion runoff "
+         "hydrology uncertainty optimization algorithm simulation scenario adaptation").split()
+
+def synthetic_keywords(count, seed=1):
+    """生成 count 个互不相同的关键词，其中约三分之一是已有关键词的变体"""
+    rng = random.Random(seed)
+    keywords = []
+    seen = set()
+    while len(keywords) < count:
+        if keywords and rng.random() < 0.35:
+            words = rng.choice(keywords).split()
+            variant = rng.randrange(4)
+            if variant == 0:
+                words[-1] += 's'
+            elif variant == 1:
+                words.reverse()
+            elif variant == 2 and len(words) > 1:
+                words = ['-'.join(words[:2])] + words[2:]
+            else:
+                i = rng.randrange(len(words))
+                word = words[i]
+                j = rng.randrange(len(word))
+                words[i] = word[:j] + rng.choice('aeiou') + word[j + 1:]
+        else:
+            words = rng.sample(WORDS, rng.randint(1, 4))
+        keyword = ' '.join(words)
+        if keyword not in seen:
+            seen.add(keyword)
+            keywords.append(keyword)
+    return keywords
+
+def legacy_group(keyword_stats, threshold=80):
+    """原先的 group_similar_keywords：每个关键词与全部关键词逐一比较"""
+    keywords = list(keyword_stats.keys())
+    groups = []
+    used = set()
+    
+    for keyword in keywords:
+        if keyword in used:
+            continue
+        
+        similar = process.extract(keyword, keywords, scorer=fuzz.token_sort_ratio)
+        similar_keywords = [k for k, score in similar if score >= threshold and k not in used]
+        
+        if similar_keywords:
+            groups.append(similar_keywords)
+            used.update(similar_keywords)
+    
+    return groups
+
+def timed(func, *args):
+    """返回函数的耗时和结果"""
+    started = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - started, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000], help="关键词数")
+    parser.add_argument('--threshold', type=int, default=80, help="相似度阈值")
+    parser.add_argument('--method', choices=KeywordAnalyzer.SIMILARITY_METHODS, default='fuzzy',
+                        help="相似度算法，tfidf 的分组结果与原方法不同，不做一致性检查")
+    parser.add_argument('--workers', type=int, default=None, help="fuzzy 方法的进程数，默认为CPU核心数")
+    parser.add_argument('--legacy-max', type=int, default=1000, help="运行原分组方法的最大关键词数")
+    args = parser.parse_args()
+    
+    analyzer = KeywordAnalyzer()
+    for size in args.sizes:
+        keyword_stats = {keyword: {'2020': 1} for keyword in synthetic_keywords(size)}
+        
+        new_time, groups = timed(analyzer.group_similar_keywords, keyword_stats, args.threshold,
+                                 args.method, args.workers)
+        line = f"{size:>7} 个关键词: {args.method} {new_time:8.2f} s, {len(groups)} 组"
+        
+        if args.method == 'fuzzy' and size <= args.legacy_max:
+            legacy_time, legacy_groups = timed(legacy_group, keyword_stats, args.threshold)
+            line += (f"; 逐一比较 {legacy_time:8.2f} s, 加速比 {legacy_time / new_time:.1f}x, "
+                     f"结果{'一致' if groups == legacy_groups else '不一致'}")
+        print(line)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
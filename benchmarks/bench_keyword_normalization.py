@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+关键词规范化基准：比较单进程与分片进程池统计关键词的耗时
+
+用法:
+    python benchmarks/bench_keyword_normalization.py [--records 100000] [--vocabulary 20000] [--workers 2 4 8]
+
+生成保存在 RecordStore 中的合成记录，分别在规范化缓存为空（首次导入）和缓存已命中
+（再次导入相同的关键词）两种情况下运行，检查各方式的统计结果和每条记录的 'Keywords'
+是否一致。分片方式中当前进程构造分片、合并结果和写入 'Keywords' 的部分是串行的，
+按阿姆达尔定律，进程再多耗时也不会低于这部分。这里用当前进程的CPU时间（不含子进程）
+衡量它，与机器的核心数无关，由此得到加速比的上限
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from benchmarks.bench_keyword_grouping import synthetic_keywords
+from modules.keyword_analyzer import KeywordAnalyzer
+from modules.record_store import RecordStore
+
+def synthetic_store(count, vocabulary, seed=1):
+    """生成 count 条记录，DE 和 ID 从 vocabulary 个关键词中按偏斜分布抽取"""
+    rng = random.Random(seed)
+    keywords = [keyword.title() if rng.random() < 0.5 else keyword
+                for keyword in synthetic_keywords(vocabulary, seed)]
+    store = RecordStore()
+    for i in range(count):
+        record = {'PY': str(2000 + i % 24), 'TI': f"Synthetic record {i}"}
+        for tag in ('DE', 'ID'):
+            picks = [keywords[min(int(rng.paretovariate(1.2)) - 1, vocabulary - 1)]
+                     if rng.random() < 0.7 else rng.choice(keywords) for _ in range(rng.randint(2, 6))]
+            record[tag] = '; '.join(picks)
+        store.append(record)
+    return store
+
+def run(store, workers, warm):
+    """
+    用新的分析器统计一次关键词
+    
+    参数:
+        store (RecordStore): 记录
+        workers (int): 进程数，1 表示单进程
+        warm (bool): 是否保留上次运行写入的规范化查找表
+    
+    返回:
+        tuple: (耗时, 当前进程的CPU时间, 关键词统计, 每条记录的 'Keywords')
+    """
+    if not warm and os.path.exists(KeywordAnalyzer.NORMALIZATION_FILE):
+        os.remove(KeywordAnalyzer.NORMALIZATION_FILE)
+    store._extra.clear()
+    
+    analyzer = KeywordAnalyzer()
+    started = time.perf_counter()
+    cpu_started = time.process_time()
+    stats = analyzer.update_from_records(store, max_workers=workers)
+    cpu_time = time.process_time() - cpu_started
+    elapsed = time.perf_counter() - started
+    return elapsed, cpu_time, stats, [record.get('Keywords') for record in store]
+
+def same(left, right):
+    """比较两次运行的统计结果和记录关键词"""
+    stats, keywords = left
+    other_stats, other_keywords = right
+    return (stats.keywords == other_stats.keywords and stats.years == other_stats.years
+            and (stats.counts == other_stats.counts).all() and keywords == other_keywords)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--records', type=int, default=100000, help="记录数")
+    parser.add_argument('--vocabulary', type=int, default=20000, help="不同关键词数")
+    parser.add_argument('--workers', type=int, nargs='+', default=[2, 4, 8], help="分片方式的进程数")
+    args = parser.parse_args()
+    
+    store = synthetic_store(args.records, args.vocabulary)
+    print(f"{len(store)} 条记录, {args.vocabulary} 个不同关键词, CPU核心数 {os.cpu_count()}")
+    
+    # 规范化查找表写在临时目录中，不影响工作目录下的查找表
+    os.chdir(tempfile.mkdtemp())
+    for warm in (False, True):
+        label = "缓存命中" if warm else "缓存为空"
+        if warm:
+            run(store, 1, False)
+        serial_time, _, *serial = run(store, 1, warm)
+        print(f"{label}: 单进程 {serial_time:7.2f} s")
+        for workers in args.workers:
+            sharded_time, parent_time, *sharded = run(store, workers, warm)
+            print(f"{label}: {workers} 个进程 {sharded_time:7.2f} s, 加速比 {serial_time / sharded_time:.2f}x, "
+                  f"当前进程串行部分 {parent_time:.2f} s（加速比上限 {serial_time / parent_time:.1f}x）, "
+                  f"结果{'一致' if same(serial, sharded) else '不一致'}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
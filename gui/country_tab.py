@@ -268,6 +268,10 @@ class CountryTab(QWidget):
         
         main_layout.addLayout(unknown_layout)
     
+    def required_fields(self):
+        """返回此标签页需要解析的字段"""
+        return self.country_analyzer.REQUIRED_FIELDS
+    
     def update_with_data(self, country_data):
         """使用新数据更新标签页
         
@@ -1,11 +1,14 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
                             QTableWidget, QTableWidgetItem, QFileDialog, 
-                            QMessageBox, QGroupBox, QLabel, QSpinBox)
-from PyQt5.QtCore import Qt
+                            QMessageBox, QGroupBox, QLabel, QSpinBox, QComboBox, QProgressBar)
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
+import time
+import threading
 import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+from modules.keyword_matrix import KeywordMatrix
 from resources.translations import get_text as _
 
 class MatplotlibCanvas(FigureCanvas):
@@ -15,14 +18,72 @@ class MatplotlibCanvas(FigureCanvas):
         self.axes = self.fig.add_subplot(111)
         super(MatplotlibCanvas, self).__init__(self.fig)
 
+class GroupingThread(QThread):
+    """用于后台对关键词分组的线程"""
+    progress_updated = pyqtSignal(int, int, list)
+    completed = pyqtSignal(list, bool)
+    
+    # 两次进度信号之间的最短间隔（秒），避免频繁刷新表格
+    PROGRESS_INTERVAL = 0.3
+    
+    def __init__(self, keyword_analyzer, keyword_stats, threshold, method):
+        super().__init__()
+        self.keyword_analyzer = keyword_analyzer
+        self.keyword_stats = keyword_stats
+        self.threshold = threshold
+        self.method = method
+        self.cancel_event = threading.Event()
+        self._last_report = 0
+    
+    def run(self):
+        try:
+            groups = self.keyword_analyzer.group_similar_keywords(
+                self.keyword_stats, self.threshold, self.method,
+                progress=self.report_progress, cancel_event=self.cancel_event)
+        except Exception as e:
+            print(f"分组线程错误: {e}")
+            groups = []
+        
+        # 发送完成信号，取消时附带已得到的分组
+        self.completed.emit(groups, self.cancel_event.is_set())
+    
+    def report_progress(self, done, total, get_groups):
+        """分组进度回调，按时间间隔节流后发出带有当前分组的信号"""
+        now = time.monotonic()
+        if now - self._last_report < self.PROGRESS_INTERVAL:
+            return
+        self._last_report = now
+        self.progress_updated.emit(done, total, [list(group) for group in get_groups()])
+    
+    def cancel(self):
+        """请求停止分组"""
+        self.cancel_event.set()
+
 class KeywordTab(QWidget):
     """Web of Science分析工具的关键词分析标签页"""
     
+    # 导出共现网络时保留的边数上限，按共现次数从高到低选取
+    NETWORK_EDGE_LIMIT = 10000
+    
+    # 新兴关键词按突发度排序，总次数低于 EMERGING_MIN_COUNT 的关键词不参与排序，
+    # 表格只显示前 EMERGING_TABLE_LIMIT 个，导出时包含全部
+    EMERGING_MIN_COUNT = 5
+    EMERGING_TABLE_LIMIT = 100
+    
     def __init__(self, keyword_analyzer):
         super().__init__()
         self.keyword_analyzer = keyword_analyzer
-        self.keyword_stats = {}
+        self.keyword_stats = KeywordMatrix()
+        self.keyword_trends = None
         self.records = []
+        self.grouping_thread = None
+        
+        # 最近一次分组完成（或取消）时得到的分组，即分组表格显示的内容；
+        # None 表示当前数据还没有分组
+        self.keyword_groups = None
+        
+        # 等待分组完成后导出的Excel文件路径
+        self.pending_export = None
         self.init_ui()
     
     def init_ui(self):
@@ -39,12 +100,29 @@ class KeywordTab(QWidget):
         self.similarity_spinner = QSpinBox()
         self.similarity_spinner.setRange(50, 100)
         self.similarity_spinner.setValue(80)
+        self.method_label = QLabel(_("similarity_method"))
+        self.method_combo = QComboBox()
+        self.method_combo.addItem(_("method_fuzzy"), "fuzzy")
+        self.method_combo.addItem(_("method_tfidf"), "tfidf")
+        self.method_combo.addItem(_("method_cluster"), "cluster")
         self.group_button = QPushButton(_("group_keywords"))
         self.group_button.clicked.connect(self.group_keywords)
+        self.cancel_group_button = QPushButton(_("cancel_grouping"))
+        self.cancel_group_button.clicked.connect(self.cancel_grouping)
+        self.cancel_group_button.setEnabled(False)
+        
+        # 分组进度条
+        self.grouping_progress = QProgressBar()
+        self.grouping_progress.setRange(0, 100)
+        self.grouping_progress.setValue(0)
         
         grouping_layout.addWidget(self.similarity_label)
         grouping_layout.addWidget(self.similarity_spinner)
+        grouping_layout.addWidget(self.method_label)
+        grouping_layout.addWidget(self.method_combo)
         grouping_layout.addWidget(self.group_button)
+        grouping_layout.addWidget(self.cancel_group_button)
+        grouping_layout.addWidget(self.grouping_progress)
         grouping_box.setLayout(grouping_layout)
         
         controls_layout.addWidget(grouping_box)
@@ -56,9 +134,12 @@ class KeywordTab(QWidget):
         self.export_excel_button.clicked.connect(self.export_to_excel)
         self.export_graph_button = QPushButton(_("export_graph"))
         self.export_graph_button.clicked.connect(self.export_graph)
+        self.export_network_button = QPushButton(_("export_network"))
+        self.export_network_button.clicked.connect(self.export_network)
         
         export_layout.addWidget(self.export_excel_button)
         export_layout.addWidget(self.export_graph_button)
+        export_layout.addWidget(self.export_network_button)
         export_box.setLayout(export_layout)
         
         controls_layout.addWidget(export_box)
@@ -81,17 +162,29 @@ class KeywordTab(QWidget):
         
         # 可视化
         plot_layout = QVBoxLayout()
+        plot_header_layout = QHBoxLayout()
         self.plot_label = QLabel(_("keyword_trend"))
+        self.plot_mode_label = QLabel(_("plot_mode"))
+        self.plot_mode_combo = QComboBox()
+        self.plot_mode_combo.addItem(_("plot_top"), "top")
+        self.plot_mode_combo.addItem(_("plot_emerging"), "emerging")
+        self.plot_mode_combo.currentIndexChanged.connect(self.update_keyword_plot)
         self.keyword_plot = MatplotlibCanvas(width=6, height=4, dpi=100)
         
-        plot_layout.addWidget(self.plot_label)
+        plot_header_layout.addWidget(self.plot_label)
+        plot_header_layout.addStretch()
+        plot_header_layout.addWidget(self.plot_mode_label)
+        plot_header_layout.addWidget(self.plot_mode_combo)
+        plot_layout.addLayout(plot_header_layout)
         plot_layout.addWidget(self.keyword_plot)
         
         table_plot_layout.addLayout(plot_layout)
         
         main_layout.addLayout(table_plot_layout)
         
-        # 分组关键词区域
+        # 分组关键词和新兴关键词区域
+        bottom_layout = QHBoxLayout()
+        
         grouped_layout = QVBoxLayout()
         self.grouped_label = QLabel(_("similar_groups"))
         self.grouped_table = QTableWidget()
@@ -100,7 +193,23 @@ class KeywordTab(QWidget):
         grouped_layout.addWidget(self.grouped_label)
         grouped_layout.addWidget(self.grouped_table)
         
-        main_layout.addLayout(grouped_layout)
+        bottom_layout.addLayout(grouped_layout)
+        
+        emerging_layout = QVBoxLayout()
+        self.emerging_label = QLabel(_("emerging_keywords"))
+        self.emerging_table = QTableWidget()
+        self.emerging_table.setEditTriggers(QTableWidget.NoEditTriggers)  # 只读
+        
+        emerging_layout.addWidget(self.emerging_label)
+        emerging_layout.addWidget(self.emerging_table)
+        
+        bottom_layout.addLayout(emerging_layout)
+        
+        main_layout.addLayout(bottom_layout)
+    
+    def required_fields(self):
+        """返回此标签页需要解析的字段（导出文章列表时还需要标题）"""
+        return self.keyword_analyzer.REQUIRED_FIELDS | {'TI'}
     
     def update_with_data(self, keyword_stats, records):
         """使用新数据更新标签页
@@ -111,32 +220,37 @@ class KeywordTab(QWidget):
         """
         self.keyword_stats = keyword_stats
         self.records = records
+        self.keyword_trends = self.keyword_analyzer.analyze_trends(keyword_stats) if keyword_stats else None
+        
+        # 之前的分组不包含新导入的关键词，需要重新分组
+        self.keyword_groups = None
+        self.update_grouped_table([])
+        self.grouping_progress.setValue(0)
         
         # 更新关键词统计表
         self.update_keyword_table()
         
         # 更新关键词趋势图
         self.update_keyword_plot()
+        
+        # 更新新兴关键词表
+        self.update_emerging_table()
     
     def update_keyword_table(self):
         """更新关键词统计表"""
         if not self.keyword_stats:
             return
-            
-        # 获取年份
-        years = sorted(set(year for keyword_data in self.keyword_stats.values() 
-                          for year in keyword_data.keys()))
         
-        # 计算每个关键词的总数
-        totals = {}
-        for keyword, year_data in self.keyword_stats.items():
-            totals[keyword] = sum(year_data.values())
+        stats = self.keyword_stats
         
-        # 按总出现次数排序关键词
-        sorted_keywords = sorted(totals.items(), key=lambda x: x[1], reverse=True)
+        # 按总出现次数排序关键词，年份列和总数列直接从计数矩阵中取出
+        years = stats.sorted_years()
+        order = stats.ranking()
+        counts = stats.year_slice(order, years).tolist()
+        totals = stats.totals()[order].tolist()
         
         # 设置表格
-        self.keyword_table.setRowCount(len(sorted_keywords))
+        self.keyword_table.setRowCount(len(order))
         self.keyword_table.setColumnCount(len(years) + 2)  # 关键词 + 年份 + 总数
         
         # 设置表头
@@ -144,17 +258,15 @@ class KeywordTab(QWidget):
         self.keyword_table.setHorizontalHeaderLabels(headers)
         
         # 填充表格
-        for i, (keyword, total) in enumerate(sorted_keywords):
-            self.keyword_table.setItem(i, 0, QTableWidgetItem(keyword))
+        for i, row in enumerate(order.tolist()):
+            self.keyword_table.setItem(i, 0, QTableWidgetItem(stats.keywords[row]))
             
-            year_counts = self.keyword_stats[keyword]
             col = 1
-            for year in years:
-                count = year_counts.get(year, 0)
+            for count in counts[i]:
                 self.keyword_table.setItem(i, col, QTableWidgetItem(str(count)))
                 col += 1
             
-            self.keyword_table.setItem(i, col, QTableWidgetItem(str(total)))
+            self.keyword_table.setItem(i, col, QTableWidgetItem(str(totals[i])))
         
         self.keyword_table.resizeColumnsToContents()
     
@@ -162,33 +274,26 @@ class KeywordTab(QWidget):
         """更新关键词趋势图"""
         if not self.keyword_stats:
             return
-            
-        self.keyword_plot.axes.clear()
-        
-        # 获取总数最多的前10个关键词
-        totals = {}
-        for keyword, year_data in self.keyword_stats.items():
-            totals[keyword] = sum(year_data.values())
         
-        top_keywords = sorted(totals.items(), key=lambda x: x[1], reverse=True)[:10]
+        self.keyword_plot.axes.clear()
         
-        # 获取年份范围
-        years = sorted(set(year for keyword_data in self.keyword_stats.values() 
-                        for year in keyword_data.keys()))
+        # 获取总数最多或突发度最高的前10个关键词和年份范围
+        stats = self.keyword_stats
+        emerging = self.plot_mode_combo.currentData() == "emerging" and self.keyword_trends is not None
+        if emerging:
+            top_rows = self.keyword_trends.ranking('burst', self.EMERGING_MIN_COUNT, 10)
+        else:
+            top_rows = stats.top(10)
+        years = stats.sorted_years()
         
         # 为每个热门关键词绘制趋势
-        for keyword, count in top_keywords:  # 修改此处，将 _ 改为 count
-            year_counts = []
-            for year in years:
-                count = self.keyword_stats[keyword].get(year, 0)
-                year_counts.append(count)
-            
-            self.keyword_plot.axes.plot(years, year_counts, marker='o', label=keyword)
+        for row, year_counts in zip(top_rows.tolist(), stats.year_slice(top_rows, years).tolist()):
+            self.keyword_plot.axes.plot(years, year_counts, marker='o', label=stats.keywords[row])
         
         # 设置轴标签和标题
         self.keyword_plot.axes.set_xlabel(_("year"))
         self.keyword_plot.axes.set_ylabel(_("count"))
-        self.keyword_plot.axes.set_title(_("keyword_trend"))
+        self.keyword_plot.axes.set_title(_("emerging_keywords") if emerging else _("keyword_trend"))
         
         # 旋转X轴标签，防止重叠
         if len(years) > 4:
@@ -201,17 +306,98 @@ class KeywordTab(QWidget):
         self.keyword_plot.fig.subplots_adjust(bottom=0.15, right=0.75)
         self.keyword_plot.draw()
     
+    def emerging_headers(self):
+        """返回新兴关键词表和导出的列标题"""
+        recent_years = self.keyword_trends.recent_years if self.keyword_trends is not None else 0
+        return [_("keyword"), _("total"), _("recent_count").format(recent_years),
+                _("slope"), _("growth_rate"), _("burst_score")]
+    
+    def update_emerging_table(self):
+        """更新按突发度排序的新兴关键词表"""
+        self.emerging_table.setRowCount(0)
+        if self.keyword_trends is None:
+            self.emerging_table.setColumnCount(0)
+            return
+        
+        rows = self.keyword_trends.table('burst', self.EMERGING_MIN_COUNT, self.EMERGING_TABLE_LIMIT)
+        
+        self.emerging_table.setRowCount(len(rows))
+        self.emerging_table.setColumnCount(6)
+        self.emerging_table.setHorizontalHeaderLabels(self.emerging_headers())
+        
+        for i, (keyword, total, recent, slope, growth, burst) in enumerate(rows):
+            values = [keyword, str(total), str(recent), f"{slope:.2f}", f"{growth:+.0%}", f"{burst:.2f}"]
+            for col, value in enumerate(values):
+                self.emerging_table.setItem(i, col, QTableWidgetItem(value))
+        
+        self.emerging_table.resizeColumnsToContents()
+    
     def group_keywords(self):
         """基于相似度阈值对关键词进行分组"""
         if not self.keyword_stats:
             QMessageBox.warning(self, _("error"), _("no_data"))
             return
         
+        # 上一次分组的线程发出完成信号后可能还没有退出
+        if self.grouping_thread is not None:
+            self.grouping_thread.wait()
+        
+        # 在后台线程中分组，期间禁止再次分组和导出。导入新文件会原地修改分析器的
+        # 关键词统计，因此线程使用关键词列表的快照
         threshold = self.similarity_spinner.value()
-        groups = self.keyword_analyzer.group_similar_keywords(self.keyword_stats, threshold)
+        method = self.method_combo.currentData()
+        self.grouping_thread = GroupingThread(self.keyword_analyzer, list(self.keyword_stats), threshold, method)
+        self.grouping_thread.progress_updated.connect(self.grouping_progress_updated)
+        self.grouping_thread.completed.connect(self.grouping_completed)
+        
+        self.group_button.setEnabled(False)
+        self.export_excel_button.setEnabled(False)
+        self.cancel_group_button.setEnabled(True)
+        self.grouping_progress.setValue(0)
+        
+        self.grouping_thread.start()
+    
+    def cancel_grouping(self):
+        """取消正在进行的分组，表格保留已得到的分组"""
+        if self.grouping_thread is not None and self.grouping_thread.isRunning():
+            self.cancel_group_button.setEnabled(False)
+            self.grouping_thread.cancel()
+    
+    def grouping_is_current(self):
+        """分组线程使用的关键词快照是否仍与当前数据一致（分组期间没有导入新的关键词）"""
+        return len(self.grouping_thread.keyword_stats) == len(self.keyword_stats)
+    
+    def grouping_progress_updated(self, done, total, groups):
+        """更新分组进度，并用目前的分组填充表格"""
+        if not self.grouping_is_current():
+            return
+        if total:
+            self.grouping_progress.setValue(int(done * 100 / total))
+        self.update_grouped_table(groups)
+    
+    def grouping_completed(self, groups, cancelled):
+        """分组完成或被取消后更新表格并恢复按钮，有等待分组的导出时继续导出"""
+        self.group_button.setEnabled(True)
+        self.export_excel_button.setEnabled(True)
+        self.cancel_group_button.setEnabled(False)
+        
+        # 分组期间导入了新的关键词时丢弃结果，等待导出时按新数据重新分组
+        if not self.grouping_is_current():
+            self.grouping_progress.setValue(0)
+            if self.pending_export is not None:
+                self.group_keywords()
+            return
         
-        # 更新分组关键词表格
+        if not cancelled:
+            self.grouping_progress.setValue(100)
+        
+        # 更新分组关键词表格，导出时使用同样的分组
+        self.keyword_groups = groups
         self.update_grouped_table(groups)
+        
+        if self.pending_export is not None:
+            file_path, self.pending_export = self.pending_export, None
+            self.write_excel(file_path)
     
     def update_grouped_table(self, groups):
         """更新分组关键词表格
@@ -242,8 +428,7 @@ class KeywordTab(QWidget):
                 self.grouped_table.setItem(row, col, QTableWidgetItem(keyword))
                 
                 # 计算此关键词的总计数
-                keyword_total = sum(self.keyword_stats.get(keyword, {}).values())
-                total += keyword_total
+                total += self.keyword_stats.total(keyword)
             
             # 添加总计数列
             self.grouped_table.setItem(row, max_keywords, QTableWidgetItem(str(total)))
@@ -263,23 +448,28 @@ class KeywordTab(QWidget):
         if not file_path:
             return
         
+        # 当前数据还没有分组时先在后台线程中分组，完成后再导出
+        if self.keyword_groups is None:
+            self.pending_export = file_path
+            self.group_keywords()
+            return
+        
+        self.write_excel(file_path)
+    
+    def write_excel(self, file_path):
+        """将关键词统计、文章、分组和新兴关键词写入Excel文件
+        
+        参数:
+            file_path (str): Excel文件路径
+        """
         try:
-            # 创建关键词统计的DataFrame
-            years = sorted(set(year for keyword_data in self.keyword_stats.values() 
-                              for year in keyword_data.keys()))
-            
-            # 用零初始化DataFrame
-            df_stats = pd.DataFrame(index=self.keyword_stats.keys(), columns=years)
-            df_stats = df_stats.fillna(0)
-            
-            # 填充实际值
-            for keyword, year_data in self.keyword_stats.items():
-                for year, count in year_data.items():
-                    df_stats.at[keyword, year] = count
-            
-            # 按总出现次数排序
-            df_stats[_("total")] = df_stats.sum(axis=1)
-            df_stats = df_stats.sort_values(by=_("total"), ascending=False)
+            # 创建关键词统计的DataFrame，按总出现次数排序
+            stats = self.keyword_stats
+            years = stats.sorted_years()
+            order = stats.ranking()
+            df_stats = pd.DataFrame(stats.year_slice(order, years),
+                                    index=[stats.keywords[row] for row in order], columns=years)
+            df_stats[_("total")] = stats.totals()[order]
             
             # 创建带有关键词的文章DataFrame
             articles_data = []
@@ -297,9 +487,15 @@ class KeywordTab(QWidget):
             
             df_articles = pd.DataFrame(articles_data)
             
-            # 获取分组关键词
-            threshold = self.similarity_spinner.value()
-            groups = self.keyword_analyzer.group_similar_keywords(self.keyword_stats, threshold)
+            # 按突发度排序的新兴关键词
+            if self.keyword_trends is not None:
+                df_emerging = pd.DataFrame(self.keyword_trends.table('burst', self.EMERGING_MIN_COUNT),
+                                           columns=self.emerging_headers())
+            else:
+                df_emerging = pd.DataFrame()
+            
+            # 导出分组表格中显示的分组，不在界面线程中重新分组
+            groups = self.keyword_groups or []
             
             # 创建分组关键词DataFrame
             grouped_data = []
@@ -314,8 +510,9 @@ class KeywordTab(QWidget):
                     group_row[f'{_("keyword")} {i+1}'] = keyword
                 
                 # 添加年份计数（汇总组中所有关键词）
-                for year in years:
-                    group_row[year] = sum(self.keyword_stats.get(kw, {}).get(year, 0) for kw in group)
+                group_counts = stats.rows(group, years).sum(axis=0).tolist()
+                for year, count in zip(years, group_counts):
+                    group_row[year] = count
                 
                 grouped_data.append(group_row)
             
@@ -331,6 +528,8 @@ class KeywordTab(QWidget):
                 df_articles.to_excel(writer, sheet_name=_("articles"), index=False)
                 if not df_grouped.empty:
                     df_grouped.to_excel(writer, sheet_name=_("similar_groups"), index=False)
+                if not df_emerging.empty:
+                    df_emerging.to_excel(writer, sheet_name=_("emerging_keywords"), index=False)
             
             QMessageBox.information(self, _("success"), _("export_success").format(file_path))
         
@@ -356,27 +555,75 @@ class KeywordTab(QWidget):
         except Exception as e:
             QMessageBox.critical(self, _("error"), _("export_error").format(str(e)))
     
+    def export_network(self):
+        """将关键词共现网络导出为 Gephi 边表或 VOSviewer 网络文件"""
+        if not self.keyword_stats:
+            QMessageBox.warning(self, _("error"), _("no_data"))
+            return
+        
+        gephi_filter = "Gephi CSV (*.csv)"
+        vosviewer_filter = "VOSviewer " + _("text_files") + " (*.txt)"
+        file_path, file_filter = QFileDialog.getSaveFileName(
+            self, _("export_network"), "", gephi_filter + ";;" + vosviewer_filter
+        )
+        
+        if not file_path:
+            return
+        
+        try:
+            # 共现矩阵只追加尚未统计的记录
+            cooccurrence = self.keyword_analyzer.update_cooccurrence(self.records)
+            file_format = 'vosviewer' if file_filter == vosviewer_filter else 'gephi'
+            cooccurrence.export_edges(file_path, file_format, limit=self.NETWORK_EDGE_LIMIT)
+            QMessageBox.information(self, _("success"), _("export_success").format(file_path))
+        except Exception as e:
+            QMessageBox.critical(self, _("error"), _("export_error").format(str(e)))
+    
     def reset(self):
         """将标签页重置为初始状态"""
-        self.keyword_stats = {}
+        # 先停止正在进行的分组，避免重置后的表格又被填充或继续导出
+        self.pending_export = None
+        if self.grouping_thread is not None and self.grouping_thread.isRunning():
+            self.grouping_thread.completed.disconnect()
+            self.grouping_thread.progress_updated.disconnect()
+            self.grouping_thread.cancel()
+            self.grouping_thread.wait()
+            self.grouping_completed([], True)
+        self.grouping_progress.setValue(0)
+        
+        self.keyword_stats = KeywordMatrix()
+        self.keyword_trends = None
+        self.keyword_groups = None
         self.records = []
         self.keyword_table.setRowCount(0)
         self.keyword_table.setColumnCount(0)
         self.grouped_table.setRowCount(0)
         self.grouped_table.setColumnCount(0)
+        self.emerging_table.setRowCount(0)
+        self.emerging_table.setColumnCount(0)
         self.keyword_plot.axes.clear()
         self.keyword_plot.draw()
-        
+    
     def update_translations(self):
         """更新标签页中的所有翻译文本"""
         # 更新按钮和标签文本
         self.table_label.setText(_("keyword_stats"))
         self.plot_label.setText(_("keyword_trend"))
         self.grouped_label.setText(_("similar_groups"))
+        self.emerging_label.setText(_("emerging_keywords"))
+        self.plot_mode_label.setText(_("plot_mode"))
+        self.plot_mode_combo.setItemText(0, _("plot_top"))
+        self.plot_mode_combo.setItemText(1, _("plot_emerging"))
         self.similarity_label.setText(_("similarity_threshold"))
+        self.method_label.setText(_("similarity_method"))
+        self.method_combo.setItemText(0, _("method_fuzzy"))
+        self.method_combo.setItemText(1, _("method_tfidf"))
+        self.method_combo.setItemText(2, _("method_cluster"))
         self.group_button.setText(_("group_keywords"))
+        self.cancel_group_button.setText(_("cancel_grouping"))
         self.export_excel_button.setText(_("export_excel"))
         self.export_graph_button.setText(_("export_graph"))
+        self.export_network_button.setText(_("export_network"))
         
         # 更新分组区域GroupBox标题
         for i in range(self.layout().count()):
@@ -398,10 +645,13 @@ class KeywordTab(QWidget):
                 years = current_headers[1:-1]  # 年份保持不变
                 new_headers = [_("keyword")] + years + [_("total")]
                 self.keyword_table.setHorizontalHeaderLabels(new_headers)
+        if self.emerging_table.columnCount() > 0:
+            self.emerging_table.setHorizontalHeaderLabels(self.emerging_headers())
         
         # 更新图表标签 - 保留此代码以支持多语言图表标签
         if hasattr(self, 'keyword_plot') and self.keyword_plot.axes:
             self.keyword_plot.axes.set_xlabel(_("year"))
             self.keyword_plot.axes.set_ylabel(_("count"))
-            self.keyword_plot.axes.set_title(_("keyword_trend"))
+            emerging = self.plot_mode_combo.currentData() == "emerging" and self.keyword_trends is not None
+            self.keyword_plot.axes.set_title(_("emerging_keywords") if emerging else _("keyword_trend"))
             self.keyword_plot.draw()
\ No newline at end of file
@@ -1,10 +1,12 @@
+import os
 from PyQt5.QtWidgets import (QMainWindow, QTabWidget, QFileDialog, QMessageBox,
                             QVBoxLayout, QHBoxLayout, QPushButton, QWidget,
-                            QLabel, QListWidget)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+                            QLabel, QListWidget, QListWidgetItem, QProgressBar)
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt5.QtGui import QIcon
-from queue import Queue
+from queue import Queue, Empty
 from modules.file_parser import WoSFileParser
+from modules.parse_cache import ParseCache
 from modules.keyword_analyzer import KeywordAnalyzer
 from modules.country_analyzer import CountryAnalyzer
 from gui.keyword_tab import KeywordTab
@@ -17,22 +19,36 @@ class ParserThread(QThread):
     progress_updated = pyqtSignal(float)
     completed = pyqtSignal(int)
     
-    def __init__(self, parser, filepath):
+    def __init__(self, parser, filepaths, fields=None):
         super().__init__()
         self.parser = parser
-        self.filepath = filepath
+        self.filepaths = filepaths
+        self.fields = fields
         self.progress_queue = Queue()
     
     def run(self):
         try:
-            # 解析文件
-            record_count = self.parser.parse_file(self.filepath, self.progress_queue)
+            # 所有文件按记录边界切分后交给进程池并发解析
+            record_count = self.parser.parse_files(self.filepaths, self.progress_queue,
+                                                   fields=self.fields)
             
             # 发送完成信号
             self.completed.emit(record_count)
         except Exception as e:
             print(f"解析线程错误: {e}")
             self.completed.emit(0)
+    
+    def poll_progress(self):
+        """读取进度队列中的最新进度并发出信号"""
+        progress = None
+        try:
+            while True:
+                progress = self.progress_queue.get_nowait()
+        except Empty:
+            pass
+        
+        if progress is not None:
+            self.progress_updated.emit(progress)
 
 class MainWindow(QMainWindow):
     """Web of Science分析工具的主窗口"""
@@ -40,8 +56,9 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         
-        # 创建分析器
-        self.file_parser = WoSFileParser()
+        # 创建分析器，解析结果缓存在磁盘上，重复导入同一文件时直接读取
+        self.parse_cache = ParseCache()
+        self.file_parser = WoSFileParser(self.parse_cache)
         self.keyword_analyzer = KeywordAnalyzer()
         self.country_analyzer = CountryAnalyzer()
         
@@ -75,9 +92,12 @@ class MainWindow(QMainWindow):
         self.file_label = QLabel(_("file_select"))
         self.browse_button = QPushButton(_("browse"))
         self.browse_button.clicked.connect(self.open_file_dialog)
+        self.folder_button = QPushButton(_("browse_folder"))
+        self.folder_button.clicked.connect(self.open_folder_dialog)
         
         file_header.addWidget(self.file_label)
         file_header.addWidget(self.browse_button)
+        file_header.addWidget(self.folder_button)
         file_layout.addLayout(file_header)
         
         # 文件列表
@@ -85,6 +105,16 @@ class MainWindow(QMainWindow):
         self.file_list.setMaximumHeight(100)
         file_layout.addWidget(self.file_list)
         
+        # 解析进度条
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(0)
+        file_layout.addWidget(self.progress_bar)
+        
+        # 定时读取解析线程的进度
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setInterval(100)
+        
         main_layout.addLayout(file_layout)
         
         # 标签页
@@ -105,10 +135,14 @@ class MainWindow(QMainWindow):
         self.reset_button = QPushButton(_("reset_all"))
         self.reset_button.clicked.connect(self.reset_data)
         
+        self.clear_cache_button = QPushButton(_("clear_cache"))
+        self.clear_cache_button.clicked.connect(self.clear_cache)
+        
         self.debug_button = QPushButton(_("debug_info"))
         self.debug_button.clicked.connect(self.show_debug_info)
         
         button_layout.addWidget(self.reset_button)
+        button_layout.addWidget(self.clear_cache_button)
         button_layout.addWidget(self.debug_button)
         
         main_layout.addLayout(button_layout)
@@ -121,9 +155,14 @@ class MainWindow(QMainWindow):
         self.setWindowTitle(_("app_title"))
         
         # 更新主窗口文本
-        self.file_label.setText(_("file_select"))
+        if self.file_list.count():
+            self.file_label.setText(f'{_("selected_files")} {self.file_list.count()}')
+        else:
+            self.file_label.setText(_("file_select"))
         self.browse_button.setText(_("browse"))
+        self.folder_button.setText(_("browse_folder"))
         self.reset_button.setText(_("reset_all"))
+        self.clear_cache_button.setText(_("clear_cache"))
         self.debug_button.setText(_("debug_info"))
         
         # 更新标签页标题
@@ -135,46 +174,110 @@ class MainWindow(QMainWindow):
         self.country_tab.update_translations()
     
     def open_file_dialog(self):
-        """打开文件选择对话框选择文件"""
+        """打开文件选择对话框选择一个或多个文件"""
         # 使用file_filter代替_作为变量名，避免与翻译函数冲突
-        file_path, file_filter = QFileDialog.getOpenFileName(
-            self, _("open_wos_files"), "", _("text_files") + " (*.txt)"
+        extensions = " ".join("*" + ext for ext in WoSFileParser.SUPPORTED_EXTENSIONS)
+        file_paths, file_filter = QFileDialog.getOpenFileNames(
+            self, _("open_wos_files"), "", _("wos_files") + f" ({extensions})"
         )
         
-        if not file_path:
+        if not file_paths:
             return  # 用户取消选择，直接返回
         
-        # 清空文件列表并添加新文件
-        self.file_list.clear()
+        self.process_files(file_paths)
+    
+    def open_folder_dialog(self):
+        """选择文件夹并导入其中所有的导出文件（包括压缩文件）"""
+        folder = QFileDialog.getExistingDirectory(self, _("open_wos_folder"))
+        
+        if not folder:
+            return
+        
+        file_paths = []
+        for root, dirs, files in os.walk(folder):
+            dirs.sort()
+            for name in sorted(files):
+                if name.lower().endswith(WoSFileParser.SUPPORTED_EXTENSIONS):
+                    file_paths.append(os.path.join(root, name))
+        
+        if not file_paths:
+            QMessageBox.warning(self, _("error"),
+                                _("no_files_in_folder").format(", ".join(WoSFileParser.SUPPORTED_EXTENSIONS)))
+            return
+        
+        self.process_files(file_paths)
+    
+    def process_files(self, file_paths):
+        """在后台线程中批量处理文件"""
+        # 列表只显示文件名（不含路径），按完整路径判断是否已列出，
+        # 不同子文件夹中同名的导出文件（如 savedrecs.txt）各占一行
+        listed = {self.file_list.item(i).data(Qt.UserRole) for i in range(self.file_list.count())}
+        for file_path in file_paths:
+            full_path = os.path.abspath(file_path)
+            if full_path not in listed:
+                item = QListWidgetItem(os.path.basename(file_path))
+                item.setData(Qt.UserRole, full_path)
+                item.setToolTip(full_path)
+                self.file_list.addItem(item)
+                listed.add(full_path)
+        self.file_label.setText(f'{_("selected_files")} {self.file_list.count()}')
+        
+        # 解析期间禁止再次导入
+        self.browse_button.setEnabled(False)
+        self.folder_button.setEnabled(False)
+        
+        # 使用线程解析文件，只保留已启用的分析需要的字段
+        self.parser_thread = ParserThread(self.file_parser, file_paths, self.required_fields())
+        self.parser_thread.progress_updated.connect(self.update_progress)
+        self.parser_thread.completed.connect(self.file_parsing_completed)
         
-        # 获取文件名（不含路径）并添加到列表
-        file_name = file_path.split('/')[-1].split('\\')[-1]  # 处理不同操作系统路径分隔符
-        self.file_list.addItem(file_name)
+        self.progress_bar.setValue(0)
+        self.progress_timer.timeout.connect(self.parser_thread.poll_progress)
+        self.progress_timer.start()
         
-        # 处理文件
-        self.process_file(file_path)
+        self.parser_thread.start()
+    
+    def required_fields(self):
+        """汇总所有已启用标签页需要解析的字段"""
+        fields = set()
+        for i in range(self.tabs.count()):
+            if self.tabs.isTabEnabled(i):
+                fields |= self.tabs.widget(i).required_fields()
+        return fields
     
     def process_file(self, file_path):
         """处理单个文件"""
-        # 使用线程解析文件
-        self.parser_thread = ParserThread(self.file_parser, file_path)
-        self.parser_thread.completed.connect(self.file_parsing_completed)
-        self.parser_thread.start()
+        self.process_files([file_path])
+    
+    def update_progress(self, progress):
+        """更新解析进度条"""
+        self.progress_bar.setValue(int(progress))
     
     def file_parsing_completed(self, record_count):
-        # 获取所有记录
+        # 停止读取进度
+        self.progress_timer.stop()
+        self.progress_timer.timeout.disconnect()
+        self.progress_bar.setValue(100)
+        self.browse_button.setEnabled(True)
+        self.folder_button.setEnabled(True)
+        
+        # 所有文件解析完成后统一获取记录，分析器只处理本次新增的记录
         records = self.file_parser.get_records()
+        new_records = self.file_parser.get_new_records()
         
-        # 关键词分析
-        keyword_stats = self.keyword_analyzer.process_keywords(records)
+        # 关键词分析，分析器保存统计并记住已处理的记录数
+        keyword_stats = self.keyword_analyzer.update_from_records(records)
         self.keyword_tab.update_with_data(keyword_stats, records)
         
         # 国家分析
-        country_stats = self.country_analyzer.analyze_countries(records)
+        country_stats = self.country_analyzer.update_countries(new_records)
         self.country_tab.update_with_data(country_stats)
         
-        QMessageBox.information(self, _("import_complete"), 
-                               _("import_success").format(record_count))
+        message = _("import_success").format(record_count)
+        if self.file_parser.last_duplicates:
+            message += "\n" + _("duplicates_skipped").format(self.file_parser.last_duplicates)
+        
+        QMessageBox.information(self, _("import_complete"), message)
     
     def reset_data(self):
         # 重置所有数据
@@ -184,9 +287,16 @@ class MainWindow(QMainWindow):
         self.keyword_tab.reset()
         self.country_tab.reset()
         self.file_list.clear()
+        self.progress_bar.setValue(0)
         self.file_label.setText(_("file_select"))
         QMessageBox.information(self, _("reset_complete"), _("reset_msg"))
     
+    def clear_cache(self):
+        # 清空磁盘上的解析缓存
+        freed = self.parse_cache.clear()
+        QMessageBox.information(self, _("reset_complete"),
+                               _("cache_cleared").format(freed / 1024 / 1024))
+    
     def show_debug_info(self):
         # 显示所有组件的调试信息
         debug_info = []
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import sys
+import multiprocessing
 import matplotlib
 matplotlib.use('Qt5Agg')
 from PyQt5.QtWidgets import QApplication
@@ -27,6 +28,9 @@ def find_suitable_font():
     return 'serif'
 
 if __name__ == "__main__":
+    # 打包为可执行文件后，解析进程池需要此调用
+    multiprocessing.freeze_support()
+    
     app = QApplication(sys.argv)
     
     # 设置UI字体
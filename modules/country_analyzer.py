@@ -1,11 +1,21 @@
 import re
 import os
 import json
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 
 class CountryAnalyzer:
     """国家分析模块，处理和分析文章的国家信息"""
     
+    # 国家分析需要解析的字段
+    REQUIRED_FIELDS = {'PY', 'C1', 'RP'}
+    
+    # 地址中的括号内容和美国邮编
+    PARENTHESES_PATTERN = re.compile(r'\([^)]*\)')
+    US_ZIP_PATTERN = re.compile(r'\b\d{5}(-\d{4})?\b')
+    
+    # 机构地址识别结果缓存的最大条目数
+    ADDRESS_CACHE_SIZE = 100000
+    
     def __init__(self):
         self.countries = defaultdict(lambda: defaultdict(int))
         self.unknown_addresses = set()
@@ -15,6 +25,22 @@ class CountryAnalyzer:
         self.user_country_mapping = self.load_user_country_mapping()
         self.default_country_mapping = self._get_default_country_mapping()
         self.country_mapping = {**self.default_country_mapping, **self.user_country_mapping}
+        
+        # 国家映射的版本号，每次修改映射时加1
+        self.mapping_version = 0
+        
+        # 由国家映射编译的匹配器，映射版本改变后在下次提取时重新编译
+        self._matcher_version = None
+        self._country_pattern = None
+        self._country_pattern_unicode = None
+        self._country_names = None
+        self._country_ranks = None
+        
+        # 机构地址到识别出的国家（未识别为None）的LRU缓存，映射版本改变后清空
+        self.address_cache = OrderedDict()
+        self._address_cache_version = self.mapping_version
+        self.address_cache_hits = 0
+        self.address_cache_misses = 0
     
     def load_user_country_mapping(self):
         """加载用户自定义的国家映射"""
@@ -41,8 +67,54 @@ class CountryAnalyzer:
         """添加新的国家映射"""
         self.user_country_mapping[original_name] = translated_name
         self.country_mapping[original_name] = translated_name
+        self.mapping_version += 1
         self.save_user_country_mapping()
     
+    def _compile_country_matcher(self):
+        """
+        将国家映射编译为正则表达式和小写名称到映射顺序的查找表
+        
+        正则表达式的分支按映射顺序排列，整体放在单词边界后的前瞻断言中，在地址的每个
+        单词边界上得到该位置能匹配的排在最前的名称，所有位置中顺序最小的名称就是逐个
+        名称搜索时第一个匹配的名称。分支不按长度排序，否则会改变原有的匹配优先级
+        """
+        self._matcher_version = self.mapping_version
+        self._country_names = list(self.country_mapping.items())
+        
+        # 同一小写名称对应多个映射时，保留排在最前的一个
+        self._country_ranks = {}
+        for rank, (name, _) in enumerate(self._country_names):
+            self._country_ranks.setdefault(name.lower(), rank)
+        
+        # ASCII地址转为小写后匹配小写名称，分支以普通字符开头时正则引擎可以快速跳过
+        branches = '|'.join(re.escape(name.lower()) + r'\b' for name, _ in self._country_names)
+        self._country_pattern = re.compile(r'\b(?=(' + branches + '))')
+        
+        # 非ASCII地址转为小写后长度和大小写对应关系可能与 IGNORECASE 不同，
+        # 改用每个名称一个捕获组的不区分大小写的表达式，由组号得到映射顺序
+        branches = '|'.join('(' + re.escape(name) + r')\b' for name, _ in self._country_names)
+        self._country_pattern_unicode = re.compile(r'\b(?=' + branches + ')', re.IGNORECASE)
+    
+    def match_country_name(self, institution):
+        """
+        查找地址中出现的国家名称（不区分大小写，按单词边界匹配）
+        
+        参数:
+            institution (str): 单个机构地址
+        
+        返回:
+            str: 排在国家映射最前的匹配名称对应的国家，未找到时为None
+        """
+        if self._matcher_version != self.mapping_version:
+            self._compile_country_matcher()
+        
+        if institution.isascii():
+            ranks = [self._country_ranks[match.group(1)]
+                     for match in self._country_pattern.finditer(institution.lower())]
+        else:
+            ranks = [match.lastindex - 1 for match in self._country_pattern_unicode.finditer(institution)]
+        return self._country_names[min(ranks)][1] if ranks else None
+    
     def _get_default_country_mapping(self):
         """获取默认的国家名称映射"""
         # 这里应该包含counter.py中的完整映射
@@ -197,8 +269,8 @@ class CountryAnalyzer:
         从记录中分析国家信息
         
         参数:
-            records (list): 记录字典列表
-            
+            records (iterable): 记录字典列表，或 WoSFileParser.iter_records 产生的记录流
+        
         返回:
             dict: 按国家和年份组织的统计
         """
@@ -206,12 +278,26 @@ class CountryAnalyzer:
         self.countries = defaultdict(lambda: defaultdict(int))
         self.unknown_addresses = set()
         
+        return self.update_countries(records)
+    
+    def update_countries(self, records):
+        """
+        将新增记录的国家信息累加到已有的统计中，已统计过的记录无需重新处理
+        
+        参数:
+            records (iterable): 新增的记录
+        
+        返回:
+            dict: 合并后按国家和年份组织的统计
+        """
         records_with_countries = 0
+        hits = self.address_cache_hits
+        misses = self.address_cache_misses
         
         for record in records:
             if 'PY' not in record:
                 continue
-                
+            
             year = record['PY']
             countries = set()
             
@@ -235,6 +321,9 @@ class CountryAnalyzer:
         
         self.debug_info.append(f"找到国家的记录数: {records_with_countries}")
         self.debug_info.append(f"找到的国家数: {len(self.countries)}")
+        self.debug_info.append(
+            f"机构地址缓存: 命中 {self.address_cache_hits - hits} 次，"
+            f"未命中 {self.address_cache_misses - misses} 次，共 {len(self.address_cache)} 条")
         
         return dict(self.countries)
     
@@ -242,9 +331,12 @@ class CountryAnalyzer:
         """
         从地址文本中提取国家名称
         
+        同一机构地址在许多记录中重复出现，每个机构地址的识别结果保存在有界的LRU缓存中，
+        以去除首尾空白后的地址为键。大小写和空白会影响匹配和未识别地址列表，因此不做归并
+        
         参数:
             address_text (str): 地址文本
-            
+        
         返回:
             tuple: (国家集合, 未识别地址集合)
         """
@@ -258,48 +350,66 @@ class CountryAnalyzer:
                 if subpart.strip():
                     institutions.append(subpart.strip())
         
+        # 映射修改后缓存的结果可能已经过时
+        cache = self.address_cache
+        if self._address_cache_version != self.mapping_version:
+            cache.clear()
+            self._address_cache_version = self.mapping_version
+        
         for institution in institutions:
-            country_found = False
-            
-            # 方法1: 查找完整的国家名称(不区分大小写)
-            for country_name, local_name in self.country_mapping.items():
-                pattern = r'\b' + re.escape(country_name) + r'\b'
-                if re.search(pattern, institution, re.IGNORECASE):
-                    countries.add(local_name)
-                    country_found = True
-                    break
-            
-            # 方法2: 查找地址末尾的国家名称
-            if not country_found:
-                # 移除括号内容
-                clean_institution = re.sub(r'\([^)]*\)', '', institution)
-                
-                # 按逗号分割
-                parts = clean_institution.split(',')
-                for i in range(len(parts)-1, -1, -1):
-                    part = parts[i].strip()
-                    for country_name, local_name in self.country_mapping.items():
-                        if part.lower() == country_name.lower():
-                            countries.add(local_name)
-                            country_found = True
-                            break
-                    if country_found:
-                        break
-            
-            # 方法3: 查找邮政编码模式
-            if not country_found:
-                # 美国邮编
-                if re.search(r'\b\d{5}(-\d{4})?\b', institution):
-                    countries.add("United States")
-                    country_found = True
-                # 其他邮编和识别逻辑...
+            if institution in cache:
+                cache.move_to_end(institution)
+                local_name = cache[institution]
+                self.address_cache_hits += 1
+            else:
+                local_name = self.identify_country(institution)
+                cache[institution] = local_name
+                if len(cache) > self.ADDRESS_CACHE_SIZE:
+                    cache.popitem(last=False)
+                self.address_cache_misses += 1
             
             # 如果未找到国家，存储该地址
-            if not country_found:
+            if local_name is None:
                 unknown_addresses.add(institution)
+            else:
+                countries.add(local_name)
         
         return countries, unknown_addresses
     
+    def identify_country(self, institution):
+        """
+        识别单个机构地址所属的国家
+        
+        参数:
+            institution (str): 单个机构地址
+        
+        返回:
+            str: 识别出的国家，未识别时为None
+        """
+        # 方法1: 查找完整的国家名称(不区分大小写)
+        local_name = self.match_country_name(institution)
+        if local_name is not None:
+            return local_name
+        
+        # 方法2: 查找地址末尾的国家名称
+        # 移除括号内容
+        clean_institution = self.PARENTHESES_PATTERN.sub('', institution)
+        
+        # 按逗号分割
+        parts = clean_institution.split(',')
+        for i in range(len(parts)-1, -1, -1):
+            rank = self._country_ranks.get(parts[i].strip().lower())
+            if rank is not None:
+                return self._country_names[rank][1]
+        
+        # 方法3: 查找邮政编码模式
+        # 美国邮编
+        if self.US_ZIP_PATTERN.search(institution):
+            return "United States"
+        # 其他邮编和识别逻辑...
+        
+        return None
+    
     def get_countries_data(self):
         """获取国家统计数据"""
         return dict(self.countries)
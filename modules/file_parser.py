@@ -1,90 +1,707 @@
 import re
 import os
+import io
+import bz2
+import gzip
+import zipfile
+import hashlib
+import threading
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from queue import Queue
+from modules.record_store import RecordStore
+from modules.wos_tokenizer import tokenize_records
+from modules.wos_tabular import is_tab_delimited, read_tab_delimited
+
+
+def _parse_byte_range(filepath, start, end, fields=None):
+    """
+    在子进程中解析文件的一个字节区间
+
+    参数:
+        filepath (str): 文本文件路径
+        start (int): 区间起始偏移（对齐到 'PT' 行）
+        end (int): 区间结束偏移
+        fields (set, optional): 需要保留的字段标签
+
+    返回:
+        RecordStore: 区间内的记录（列式存储，跨进程传输比字典列表更紧凑）
+    """
+    store = RecordStore()
+    store.extend(WoSFileParser().iter_records(filepath, start=start, end=end, fields=fields))
+    return store
+
 
 class WoSFileParser:
     """Web of Science文件解析器，从文本文件中提取记录"""
     
-    def __init__(self):
-        self.records = []
+    # 流式读取时的缓冲区大小（字节）
+    CHUNK_SIZE = 1024 * 1024
+    
+    # 并行解析时每个字节区间的目标大小（字节）
+    RANGE_SIZE = 16 * 1024 * 1024
+    
+    # 可导入的文件扩展名：纯文本导出文件，以及压缩文件和zip压缩包
+    SUPPORTED_EXTENSIONS = ('.txt', '.gz', '.bz2', '.zip')
+    COMPRESSED_EXTENSIONS = ('.gz', '.bz2', '.zip')
+    
+    # 记录去重需要的字段：入藏号、DOI，以及作为后备的标题和年份
+    DEDUP_FIELDS = {'UT', 'DI', 'TI', 'PY'}
+    
+    def __init__(self, cache=None):
+        self.records = RecordStore()
         self.debug_info = []
         self.processed_files = []
+        self._processed_set = set()
+        
+        # 已导入记录的去重键（UT入藏号，或DOI/标题哈希）
+        self._seen_keys = set()
+        self.duplicates_dropped = 0
+        self.last_duplicates = 0
+        
+        # 每个文件最后一条完整记录的位置和校验和，用于只解析文件末尾新追加的部分；
+        # 压缩文件和制表符分隔文件无法从中间读取，只记录文件大小和修改时间
+        self._file_marks = {}
+        
+        # 最近一次导入前的记录数，之后的记录即本次新增的记录
+        self._import_start = 0
+        
+        # 解析结果的磁盘缓存（ParseCache），None表示不使用缓存
+        self.cache = cache
+        
+        # 多个解析任务合并结果时使用的锁
+        self._lock = threading.Lock()
+    
+    def iter_records(self, filepath, progress_queue=None, start=0, end=None, fields=None):
+        """
+        逐条读取Web of Science导出文件中的记录
+        
+        文件按块读取，由单遍分词器切分字段，每当遇到 'ER' 行或下一条记录的
+        'PT' 行时产出一条记录，因此内存占用只取决于单条记录的大小，而与文件大小无关。
+        所有记录类型（PT J/B/S/C等）都会被解析。首行为制表符分隔的字段标签时按
+        制表符分隔格式读取。压缩文件（.gz、.bz2）和zip压缩包中的文本文件边解压边读取，
+        不写临时文件，此时忽略 start 和 end。文本文件末尾缺少 'ER' 行的不完整记录不产出
+        
+        参数:
+            filepath (str): 文本文件路径
+            progress_queue (Queue, optional): 进度更新队列
+            start (int): 开始读取的字节偏移，应对齐到行首
+            end (int, optional): 结束字节偏移，只产出 'PT' 行位于该偏移之前的记录
+            fields (set, optional): 需要保留的字段标签，None表示保留全部字段
+            
+        产出:
+            dict: 单条记录的字段字典
+        """
+        if self.is_compressed(filepath):
+            yield from self._iter_compressed_records(filepath, progress_queue, fields)
+            return
+        
+        with open(filepath, 'rb', buffering=self.CHUNK_SIZE) as file:
+            if start == 0 and is_tab_delimited(file.peek(64)):
+                file_size = os.fstat(file.fileno()).st_size
+                report = self._position_reporter(file, file_size, progress_queue)
+                yield from read_tab_delimited(file, fields, report)
+                return
+            
+            # 读到文件末尾时，缺少 'ER' 的最后一条记录可能还在写入，暂不产出；
+            # 续读位置（_mark_processed）同样停在最后一个 'ER' 行，追加完整后再解析
+            at_end = end is None or end >= os.fstat(file.fileno()).st_size
+            lines = self._iter_lines(file, progress_queue, start, end)
+            yield from tokenize_records(lines, fields, complete_only=at_end)
+    
+    def is_compressed(self, filepath):
+        """判断文件是否为压缩文件或zip压缩包"""
+        return filepath.lower().endswith(self.COMPRESSED_EXTENSIONS)
+    
+    def is_tab_delimited(self, filepath):
+        """判断未压缩的文件是否为制表符分隔格式"""
+        with open(filepath, 'rb') as file:
+            return is_tab_delimited(file.read(64))
+    
+    def _open_streams(self, filepath, file):
+        """
+        打开压缩文件中的解压数据流
+        
+        参数:
+            filepath (str): 压缩文件路径，按扩展名选择解压方式
+            file: 以二进制模式打开的压缩文件
+            
+        产出:
+            解压后的二进制数据流；zip压缩包按顺序产出其中每个 .txt 文件
+        """
+        name = filepath.lower()
+        if name.endswith('.gz'):
+            yield gzip.GzipFile(fileobj=file)
+        elif name.endswith('.bz2'):
+            yield bz2.BZ2File(file)
+        else:
+            with zipfile.ZipFile(file) as archive:
+                for info in archive.infolist():
+                    if not info.is_dir() and info.filename.lower().endswith('.txt'):
+                        yield io.BufferedReader(archive.open(info))
+    
+    def _iter_compressed_records(self, filepath, progress_queue, fields):
+        """
+        从压缩文件中流式读取记录，按已读取的压缩数据量报告进度
+        
+        参数:
+            filepath (str): 压缩文件路径
+            progress_queue (Queue, optional): 进度更新队列
+            fields (set, optional): 需要保留的字段标签
+            
+        产出:
+            dict: 单条记录的字段字典
+        """
+        file_size = os.path.getsize(filepath)
+        
+        with open(filepath, 'rb', buffering=self.CHUNK_SIZE) as file:
+            report = self._position_reporter(file, file_size, progress_queue)
+            for stream in self._open_streams(filepath, file):
+                with stream:
+                    # 每个解压数据流（zip中的每个文件）分别判断格式
+                    if is_tab_delimited(stream.peek(64)):
+                        yield from read_tab_delimited(stream, fields, report)
+                        continue
+                    
+                    lines = self._iter_stream_lines(stream, report)
+                    yield from tokenize_records(lines, fields)
+    
+    def _iter_stream_lines(self, stream, report=None):
+        """从解压数据流中读取字节行，每隔一定行数报告一次进度"""
+        for line_number, line in enumerate(stream):
+            yield line
+            if report is not None and line_number % 4096 == 0:
+                report()
+    
+    def _position_reporter(self, file, file_size, progress_queue):
+        """
+        创建按文件读取位置报告进度的函数
+        
+        参数:
+            file: 以二进制模式打开的文件
+            file_size (int): 文件大小
+            progress_queue (Queue, optional): 进度更新队列
+            
+        返回:
+            callable: 报告进度的函数，不需要报告进度时返回None
+        """
+        if not progress_queue or file_size <= 0:
+            return None
+        
+        last_progress = -1
+        
+        def report():
+            nonlocal last_progress
+            progress = min(100, int(file.tell() * 100 / file_size))
+            if progress != last_progress:
+                last_progress = progress
+                progress_queue.put(progress)
+        
+        return report
+    
+    def _iter_lines(self, file, progress_queue, start, end):
+        """
+        从二进制文件中读取字节行，读到区间之后的第一条 'PT' 行时停止
+        
+        参数:
+            file: 以二进制模式打开的文件
+            progress_queue (Queue, optional): 进度更新队列
+            start (int): 开始读取的字节偏移
+            end (int, optional): 结束字节偏移
+            
+        产出:
+            bytes: 原始字节行
+        """
+        if end is None:
+            end = os.fstat(file.fileno()).st_size
+        offset = start
+        last_progress = -1
         
-    def parse_file(self, filepath, progress_queue=None):
+        file.seek(start)
+        for line in file:
+            # 下一条记录属于后续区间
+            if offset >= end and line.startswith(b'PT '):
+                break
+            offset += len(line)
+            yield line
+            
+            # 更新进度（仅在百分比变化时发送）
+            if progress_queue and end > start:
+                progress = int((offset - start) * 100 / (end - start))
+                if progress != last_progress:
+                    last_progress = progress
+                    progress_queue.put(progress)
+    
+    def parse_file(self, filepath, progress_queue=None, fields=None):
         """
         解析Web of Science导出的文本文件
         
         参数:
             filepath (str): 文本文件路径
             progress_queue (Queue, optional): 进度更新队列
+            fields (set, optional): 需要保留的字段标签，None表示保留全部字段
             
         返回:
             int: 解析的记录数
         """
-        # 检查文件是否已处理
-        if filepath in self.processed_files:
-            self.debug_info.append(f"文件 {filepath} 已处理过，跳过")
-            return 0
-            
+        # 已处理的文件只解析上次之后追加的部分
+        start = 0
+        if filepath in self._processed_set:
+            start = self.resume_offset(filepath)
+            if start is None:
+                self.debug_info.append(f"文件 {filepath} 已处理过，跳过")
+                return 0
+        
+        if fields is not None:
+            fields = set(fields) | self.DEDUP_FIELDS
+        
+        # 记录处理前的记录数
+        previous_count = len(self.records)
+        self._import_start = previous_count
+        new_keys = []
+        duplicates = 0
+        
         try:
-            with open(filepath, 'r', encoding='utf-8') as file:
-                content = file.read()
+            end = os.path.getsize(filepath)
+            for record in self.iter_records(filepath, progress_queue, start, end, fields):
+                key = self.record_key(record)
+                if key is not None:
+                    if key in self._seen_keys:
+                        duplicates += 1
+                        continue
+                    self._seen_keys.add(key)
+                    new_keys.append(key)
+                self.records.append(record)
             
             # 记录已处理文件
-            self.processed_files.append(filepath)
+            self._mark_processed(filepath, end)
+            self.last_duplicates = duplicates
+            self._report_duplicates(filepath, duplicates)
             
             # 添加调试信息
-            self.debug_info.append(f"读取文件 {os.path.basename(filepath)} 成功")
-            
-            # 通过 'PT J' 分割文章
-            articles = re.split(r'PT J\n', content)
+            self._report_success(filepath, start)
             
-            # 记录处理前的记录数
-            previous_count = len(self.records)
+            # 返回新增记录数
+            return len(self.records) - previous_count
             
-            total_articles = len(articles)
+        except Exception as e:
+            # 丢弃出错文件中已读取的部分记录
+            self.records.truncate(previous_count)
+            self._seen_keys.difference_update(new_keys)
+            error_msg = f"解析文件 {os.path.basename(filepath)} 时出错: {str(e)}"
+            self.debug_info.append(error_msg)
+            return 0
+    
+    def find_record_boundaries(self, filepath, range_count, start=0):
+        """
+        将文件划分为若干对齐到记录边界的字节区间
+        
+        参数:
+            filepath (str): 文本文件路径
+            range_count (int): 期望的区间数
+            start (int): 开始划分的字节偏移
             
-            for i, article in enumerate(articles):
-                if not article.strip():
+        返回:
+            list: (起始偏移, 结束偏移) 元组列表，除第一个区间外每个起始偏移都位于 'PT' 行行首
+        """
+        file_size = os.path.getsize(filepath)
+        boundaries = [start]
+        
+        with open(filepath, 'rb') as file:
+            for i in range(1, range_count):
+                target = start + (file_size - start) * i // range_count
+                if target <= boundaries[-1]:
                     continue
                 
-                # 提取记录数据
-                record = {}
-                current_field = None
-                
-                for line in article.split('\n'):
-                    line = line.strip()
-                    if not line:
-                        continue
-                        
-                    # 检查是否是新字段
-                    if re.match(r'^[A-Z][A-Z](\s|\t)', line):
-                        current_field = line[:2]
-                        record[current_field] = line[3:].strip()
-                    # 字段的延续
-                    elif current_field:
-                        record[current_field] += " " + line
+                # 跳过目标位置所在的不完整行，再向后寻找下一条 'PT' 行
+                file.seek(target - 1)
+                file.readline()
+                position = file.tell()
+                for raw_line in iter(file.readline, b''):
+                    if raw_line.startswith(b'PT '):
+                        if position > boundaries[-1]:
+                            boundaries.append(position)
+                        break
+                    position += len(raw_line)
+        
+        boundaries.append(file_size)
+        return list(zip(boundaries[:-1], boundaries[1:]))
+    
+    def split_file(self, filepath, workers=1, start=0):
+        """
+        计算一个文件的解析区间
+        
+        参数:
+            filepath (str): 文本文件路径
+            workers (int): 可用的进程数
+            start (int): 开始解析的字节偏移
+            
+        返回:
+            list: (起始偏移, 结束偏移) 元组列表；小文件只有一个区间
+        """
+        file_size = os.path.getsize(filepath)
+        if file_size - start < self.RANGE_SIZE or workers <= 1 or self.is_compressed(filepath):
+            # 压缩文件无法从中间开始解压，只能整体顺序解析
+            return [(start, file_size)]
+        if self.is_tab_delimited(filepath):
+            # 制表符分隔格式的每个区间都需要首行的字段标签，整体由CSV读取器解析
+            return [(start, file_size)]
+        
+        range_count = max(workers, -(-(file_size - start) // self.RANGE_SIZE))
+        return self.find_record_boundaries(filepath, range_count, start)
+    
+    def find_last_record(self, filepath, end):
+        """
+        查找文件中指定偏移之前最后一条完整记录的位置
+        
+        参数:
+            filepath (str): 文本文件路径
+            end (int): 查找的结束偏移
+            
+        返回:
+            tuple: (记录起始偏移, 'ER' 行之后的偏移, 记录内容的校验和)，没有完整记录时返回None
+        """
+        window = self.CHUNK_SIZE
+        with open(filepath, 'rb') as file:
+            while True:
+                window_start = max(0, end - window)
+                file.seek(window_start)
+                data = file.read(end - window_start)
                 
-                if record:
-                    self.records.append(record)
+                # 最后一个 'ER' 行，以及它之前最近的 'PT' 行
+                record_end = None
+                for match in re.finditer(rb'^ER[ \t]*\r?(?:\n|$)', data, re.M):
+                    record_end = match.end()
+                if record_end is not None:
+                    record_start = data.rfind(b'\nPT ', 0, record_end)
+                    if record_start >= 0:
+                        record_start += 1
+                    elif data.startswith(b'PT ') and window_start == 0:
+                        record_start = 0
+                    if record_start >= 0:
+                        checksum = hashlib.blake2b(data[record_start:record_end],
+                                                   digest_size=16).hexdigest()
+                        return (window_start + record_start, window_start + record_end, checksum)
                 
-                # 更新进度
-                if progress_queue and total_articles > 0:
-                    progress_queue.put((i + 1) / total_articles * 100)
+                if window_start == 0:
+                    return None
+                window *= 2
+    
+    def resume_offset(self, filepath):
+        """
+        计算已处理文件需要继续解析的起始偏移
+        
+        上次解析的最后一条完整记录仍然位于原位置且内容未变时，只需解析其后追加的部分；
+        否则文件已被改写，从头重新解析，已导入的记录由去重键过滤
+        
+        参数:
+            filepath (str): 文本文件路径
             
-            # 返回新增记录数
-            return len(self.records) - previous_count
+        返回:
+            int: 起始偏移，文件没有新增内容时返回None
+        """
+        mark = self._file_marks.get(filepath)
+        if mark is None:
+            return 0
+        
+        record_start, record_end, checksum = mark
+        if record_start is None:
+            # 只记录了大小和修改时间的文件，未变化时跳过，否则从头重新解析
+            try:
+                stat = os.stat(filepath)
+            except OSError:
+                return 0
+            if (stat.st_size, stat.st_mtime_ns) == (record_end, checksum):
+                return None
+            self.debug_info.append(f"文件 {os.path.basename(filepath)} 已被修改，重新解析")
+            return 0
+        try:
+            file_size = os.path.getsize(filepath)
+            if file_size >= record_end:
+                with open(filepath, 'rb') as file:
+                    file.seek(record_start)
+                    data = file.read(record_end - record_start)
+                    trailer = file.read(64)
+                if hashlib.blake2b(data, digest_size=16).hexdigest() == checksum:
+                    # 最后一条记录之后只剩文件结束标记 'EF' 时没有新增内容
+                    if trailer.strip() in (b'', b'EF'):
+                        return None
+                    return record_end
+        except OSError:
+            return 0
+        
+        self.debug_info.append(f"文件 {os.path.basename(filepath)} 已被修改，重新解析")
+        return 0
+    
+    def parse_files(self, filepaths, progress_queue=None, max_workers=None, fields=None):
+        """
+        使用有界进程池并发解析多个Web of Science导出文件
+        
+        每个文件按记录边界切分为字节区间，所有文件的区间共用一个进程池，
+        结果按文件顺序和区间顺序合并到当前解析器中，每完成一个区间更新一次进度。
+        启用缓存时，命中缓存的文件直接读取缓存结果，新解析的文件写入缓存
+        
+        参数:
+            filepaths (list): 文本文件路径列表
+            progress_queue (Queue, optional): 进度更新队列
+            max_workers (int, optional): 最大进程数，默认为CPU核心数
+            fields (set, optional): 需要保留的字段标签，None表示保留全部字段
             
-        except Exception as e:
-            error_msg = f"解析文件 {os.path.basename(filepath)} 时出错: {str(e)}"
-            self.debug_info.append(error_msg)
+        返回:
+            int: 解析的记录数
+        """
+        workers = max_workers or os.cpu_count() or 1
+        if fields is not None:
+            fields = set(fields) | self.DEDUP_FIELDS
+        self.last_duplicates = 0
+        self._import_start = len(self.records)
+        
+        # 过滤重复选择和没有新增内容的文件，并为每个文件划分区间；
+        # 已处理的文件只解析上次之后追加的部分
+        pending = []
+        pending_set = set()
+        file_ranges = []
+        file_ends = []
+        for filepath in filepaths:
+            if filepath in pending_set:
+                continue
+            try:
+                start = 0
+                if filepath in self._processed_set:
+                    start = self.resume_offset(filepath)
+                    if start is None:
+                        self.debug_info.append(f"文件 {filepath} 已处理过，跳过")
+                        continue
+                ranges = self.split_file(filepath, workers, start)
+                file_ranges.append(ranges)
+                file_ends.append(ranges[-1][1])
+                pending.append(filepath)
+                pending_set.add(filepath)
+            except Exception as e:
+                self.debug_info.append(f"解析文件 {os.path.basename(filepath)} 时出错: {str(e)}")
+        
+        if not pending:
             return 0
+        
+        previous_count = len(self.records)
+        file_starts = [ranges[0][0] for ranges in file_ranges]
+        finished = [{} for _ in pending]
+        failed = set()
+        cached = set()
+        next_file = 0
+        bytes_done = 0
+        
+        # 读取缓存的解析结果
+        if self.cache is not None:
+            for file_index, filepath in enumerate(pending):
+                if file_starts[file_index] > 0:
+                    continue
+                try:
+                    records = self.cache.load(filepath, fields)
+                except OSError:
+                    records = None
+                if records is not None:
+                    cached.add(file_index)
+                    file_ranges[file_index] = [(0, 0)]
+                    finished[file_index][0] = records
+        
+        jobs = [(file_index, range_index)
+                for file_index, ranges in enumerate(file_ranges) if file_index not in cached
+                for range_index in range(len(ranges))]
+        total_bytes = sum(end - start for ranges in file_ranges for start, end in ranges)
+        
+        def flush():
+            # 按文件顺序合并所有区间都已完成的文件
+            nonlocal next_file
+            while next_file < len(pending):
+                if next_file not in failed:
+                    if len(finished[next_file]) < len(file_ranges[next_file]):
+                        break
+                    self._merge_file(pending[next_file], finished[next_file],
+                                     len(file_ranges[next_file]), fields, next_file in cached,
+                                     file_starts[next_file], file_ends[next_file])
+                next_file += 1
+        
+        def job_done(file_index, range_index, result):
+            nonlocal bytes_done
+            filepath = pending[file_index]
+            start, end = file_ranges[file_index][range_index]
+            bytes_done += end - start
+            
+            if isinstance(result, Exception):
+                failed.add(file_index)
+                finished[file_index].clear()
+                self.debug_info.append(f"解析文件 {os.path.basename(filepath)} 时出错: {str(result)}")
+            elif file_index not in failed:
+                finished[file_index][range_index] = result
+            
+            if progress_queue and total_bytes > 0:
+                progress_queue.put(int(bytes_done * 100 / total_bytes))
+            
+            flush()
+        
+        flush()
+        
+        if workers <= 1 or len(jobs) <= 1:
+            # 单个区间或单核时直接在当前进程中解析
+            for file_index, range_index in jobs:
+                start, end = file_ranges[file_index][range_index]
+                try:
+                    queue = progress_queue if len(jobs) == 1 else None
+                    result = RecordStore()
+                    result.extend(self.iter_records(pending[file_index], queue, start, end, fields))
+                except Exception as e:
+                    result = e
+                job_done(file_index, range_index, result)
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+                futures = {}
+                for file_index, range_index in jobs:
+                    start, end = file_ranges[file_index][range_index]
+                    future = executor.submit(_parse_byte_range, pending[file_index], start, end, fields)
+                    futures[future] = (file_index, range_index)
+                
+                for future in as_completed(futures):
+                    file_index, range_index = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = e
+                    job_done(file_index, range_index, result)
+        
+        if progress_queue and not jobs:
+            progress_queue.put(100)
+        
+        return len(self.records) - previous_count
+    
+    def _merge_file(self, filepath, range_results, range_count, fields=None, from_cache=False,
+                    start=0, end=None):
+        """按区间顺序将一个文件的解析结果去重后合并到记录列表中，并写入缓存"""
+        if range_count > 1:
+            file_records = RecordStore()
+            for range_index in range(range_count):
+                file_records.extend(range_results.pop(range_index))
+        else:
+            file_records = range_results.pop(0)
+        
+        with self._lock:
+            kept_rows = []
+            for row, record in enumerate(file_records):
+                key = self.record_key(record)
+                if key is not None:
+                    if key in self._seen_keys:
+                        continue
+                    self._seen_keys.add(key)
+                kept_rows.append(row)
+            
+            duplicates = len(file_records) - len(kept_rows)
+            if duplicates:
+                self.records.extend(file_records[row] for row in kept_rows)
+            else:
+                self.records.extend(file_records)
+            
+            self.last_duplicates += duplicates
+        
+        self._mark_processed(filepath, end)
+        self._report_duplicates(filepath, duplicates)
+        
+        if from_cache:
+            self.debug_info.append(f"读取文件 {os.path.basename(filepath)} 成功（使用缓存）")
+            return
+        
+        # 缓存只保存整个文件的解析结果
+        if self.cache is not None and start == 0:
+            self.cache.store(filepath, fields, file_records)
+        
+        self._report_success(filepath, start, range_count)
+    
+    def _mark_processed(self, filepath, end):
+        """记录已处理的文件，以及解析范围内最后一条完整记录的位置"""
+        if filepath not in self._processed_set:
+            self.processed_files.append(filepath)
+            self._processed_set.add(filepath)
+        
+        if end is None:
+            return
+        try:
+            if self.is_compressed(filepath) or self.is_tab_delimited(filepath):
+                stat = os.stat(filepath)
+                mark = (None, stat.st_size, stat.st_mtime_ns)
+            else:
+                mark = self.find_last_record(filepath, end)
+        except OSError:
+            mark = None
+        if mark is not None:
+            self._file_marks[filepath] = mark
+    
+    def _report_success(self, filepath, start, range_count=1):
+        """记录文件读取成功的调试信息"""
+        name = os.path.basename(filepath)
+        if start > 0:
+            self.debug_info.append(f"读取文件 {name} 新增部分成功（从偏移 {start} 开始）")
+        elif range_count > 1:
+            self.debug_info.append(f"读取文件 {name} 成功（{range_count} 个区间并行解析）")
+        else:
+            self.debug_info.append(f"读取文件 {name} 成功")
+    
+    def record_key(self, record):
+        """
+        计算记录的去重键
+        
+        优先使用WoS入藏号(UT)，没有时使用DOI，再没有时使用标题和年份的哈希
+        
+        参数:
+            record (dict): 记录字典
+            
+        返回:
+            str: 去重键，无法识别记录时返回None
+        """
+        accession = record.get('UT')
+        if accession:
+            return 'UT:' + accession.strip().upper()
+        
+        doi = record.get('DI')
+        if doi:
+            return 'DI:' + doi.strip().lower()
+        
+        title = record.get('TI')
+        if title:
+            normalized = ' '.join(re.findall(r'\w+', title.lower()))
+            digest = hashlib.blake2b(f"{normalized}|{record.get('PY', '')}".encode('utf-8'),
+                                     digest_size=16).hexdigest()
+            return 'TI:' + digest
+        
+        return None
+    
+    def _report_duplicates(self, filepath, duplicates):
+        """记录丢弃的重复记录数"""
+        if duplicates:
+            self.duplicates_dropped += duplicates
+            self.debug_info.append(f"文件 {os.path.basename(filepath)} 中丢弃 {duplicates} 条重复记录")
+    
+    def parse_file_parallel(self, filepath, progress_queue=None, max_workers=None, fields=None):
+        """
+        使用多个进程并行解析单个Web of Science导出文件
+        
+        参数:
+            filepath (str): 文本文件路径
+            progress_queue (Queue, optional): 进度更新队列
+            max_workers (int, optional): 最大进程数，默认为CPU核心数
+            fields (set, optional): 需要保留的字段标签，None表示保留全部字段
+            
+        返回:
+            int: 解析的记录数
+        """
+        return self.parse_files([filepath], progress_queue, max_workers, fields)
     
     def get_records(self):
         """获取所有解析的记录"""
         return self.records
     
+    def get_new_records(self):
+        """获取最近一次导入新增的记录"""
+        return self.records[self._import_start:]
+    
     def get_processed_files(self):
         """获取已处理的文件列表"""
         return self.processed_files
@@ -95,6 +712,12 @@ class WoSFileParser:
     
     def reset(self):
         """重置解析器状态"""
-        self.records = []
+        self.records = RecordStore()
         self.debug_info = []
-        self.processed_files = []
\ No newline at end of file
+        self.processed_files = []
+        self._processed_set = set()
+        self._seen_keys = set()
+        self.duplicates_dropped = 0
+        self.last_duplicates = 0
+        self._file_marks = {}
+        self._import_start = 0
\ No newline at end of file
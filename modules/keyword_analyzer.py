@@ -1,15 +1,188 @@
-from collections import defaultdict
+import os
+import json
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 import inflect
-from fuzzywuzzy import fuzz
-from fuzzywuzzy import process
+import numpy as np
+from modules.keyword_cooccurrence import KeywordCooccurrence
+from modules.keyword_matrix import KeywordMatrix
+from modules.keyword_sketch import KeywordSketch
+from modules.keyword_trends import KeywordTrends
+from modules.record_store import RecordStore
+from modules.keyword_similarity import KeywordSimilarityIndex, KeywordClusterer, TfidfSimilarityIndex
+
+# 子进程中的分析器，由进程池初始化时创建
+_worker_analyzer = None
+
+def _init_normalization_worker():
+    """进程池初始化函数，每个子进程创建一个分析器并加载规范化查找表"""
+    global _worker_analyzer
+    _worker_analyzer = KeywordAnalyzer()
+
+def _decode_column(data, base, column, count):
+    """将 RecordStore.column_slices 取出的一列解码为字段值列表，缺失值为None"""
+    if column is None:
+        return [None] * count
+    starts, lengths = column
+    return [data[start - base:start - base + length].decode('utf-8') if start >= 0 else None
+            for start, length in zip(starts, lengths)]
+
+def _normalize_shard(shard):
+    """
+    在子进程中解码并规范化一个分片的记录的关键词
+    
+    参数:
+        shard (tuple): RecordStore.column_slices 取出的 (文本字节, 起始偏移, {标签: (偏移数组, 长度数组)})
+                       和分片的记录数
+    
+    返回:
+        tuple: (按首次出现排列的年份, 按首次出现排列的分片关键词表, 计数的关键词编号数组、
+               年份编号数组和次数数组, 每条记录的关键词列表（没有年份的记录为None）,
+               新规范化的关键词, 规范化缓存命中数, 未命中数)
+    """
+    (data, base, columns), count = shard
+    analyzer = _worker_analyzer
+    analyzer.learned_normalizations = {}
+    hits = analyzer.normalization_hits
+    misses = analyzer.normalization_misses
+    
+    values = {tag: _decode_column(data, base, columns.get(tag), count) for tag in ('PY', 'DE', 'ID')}
+    years = {}
+    vocabulary = {}
+    keyword_ids = []
+    year_ids = []
+    record_keywords = []
+    for year, de, id_ in zip(values['PY'], values['DE'], values['ID']):
+        if year is None:
+            record_keywords.append(None)
+            continue
+        
+        year_id = years.setdefault(year, len(years))
+        record = {tag: value for tag, value in (('DE', de), ('ID', id_)) if value is not None}
+        keywords = analyzer.record_keywords(record)
+        for keyword in keywords:
+            keyword_ids.append(vocabulary.setdefault(keyword, len(vocabulary)))
+            year_ids.append(year_id)
+        record_keywords.append(keywords)
+    
+    # 合并相同的 (关键词, 年份)，只返回出现过的单元格
+    width = max(len(years), 1)
+    cells, counts = np.unique(np.array(keyword_ids, dtype=np.int64) * width
+                              + np.array(year_ids, dtype=np.int64), return_counts=True)
+    return (list(years), list(vocabulary), cells // width, cells % width, counts, record_keywords,
+            analyzer.learned_normalizations,
+            analyzer.normalization_hits - hits, analyzer.normalization_misses - misses)
 
 class KeywordAnalyzer:
     """关键词分析模块，处理和分析文章关键词"""
     
+    # 关键词分析需要解析的字段
+    REQUIRED_FIELDS = {'PY', 'DE', 'ID'}
+    
+    # 关键词规范化结果的持久化查找表
+    NORMALIZATION_FILE = 'keyword_normalization.json'
+    
+    # 内存中规范化缓存的最大条目数
+    NORMALIZATION_CACHE_SIZE = 200000
+    
+    # 关键词分组可选的相似度计算方法：fuzzywuzzy 的 token_sort_ratio，字符 n-gram TF-IDF 余弦相似度，
+    # 或基于 token_sort_ratio 的增量并查集聚类
+    SIMILARITY_METHODS = ('fuzzy', 'tfidf', 'cluster')
+    
+    # TF-IDF 方法每次稀疏矩阵乘法的关键词数，用于限制内存占用
+    TFIDF_CHUNK_SIZE = 256
+    
+    # 关键词数不少于此值时，fuzzy 方法的相似度计算交给进程池
+    PARALLEL_MIN_KEYWORDS = 2000
+    
+    # 近似统计中每个年份摘要监视的关键词数
+    SKETCH_CAPACITY = 10000
+    
+    # 关键词规范化分片的记录数，新增记录不少于两个分片时交给进程池
+    NORMALIZATION_SHARD_SIZE = 5000
+    
+    # 趋势分析中视为"最近"的年份数
+    TREND_RECENT_YEARS = 3
+    
     def __init__(self):
         self.p = inflect.engine()
         self.debug_info = []
         
+        # 原始关键词到规范化结果的LRU缓存，启动时从查找表加载
+        self.normalization_cache = self.load_normalization_table()
+        self._normalization_dirty = False
+        self.normalization_hits = 0
+        self.normalization_misses = 0
+        
+        # 子进程中记录本分片新规范化的关键词，由父进程合并到缓存中
+        self.learned_normalizations = None
+        
+        # 增量关键词聚类，导入新文件后只需加入新出现的关键词
+        self.keyword_clusterer = None
+        
+        # 分析器保存的关键词统计，以及解析器记录列表中已统计的记录数（高水位）
+        self.keyword_stats = KeywordMatrix()
+        self.records_processed = 0
+        
+        # 关键词共现统计，以及其中已加入的记录数
+        self.cooccurrence = KeywordCooccurrence()
+        self.cooccurrence_records = 0
+    
+    def load_normalization_table(self):
+        """加载保存的关键词规范化查找表"""
+        table = OrderedDict()
+        if os.path.exists(self.NORMALIZATION_FILE):
+            try:
+                with open(self.NORMALIZATION_FILE, 'r', encoding='utf-8') as f:
+                    table.update(json.load(f))
+            except:
+                return OrderedDict()
+        
+        while len(table) > self.NORMALIZATION_CACHE_SIZE:
+            table.popitem(last=False)
+        return table
+    
+    def save_normalization_table(self):
+        """保存关键词规范化查找表，缓存没有变化时不写文件"""
+        if not self._normalization_dirty:
+            return True
+        try:
+            with open(self.NORMALIZATION_FILE, 'w', encoding='utf-8') as f:
+                json.dump(self.normalization_cache, f, ensure_ascii=False)
+            self._normalization_dirty = False
+            return True
+        except:
+            return False
+    
+    def normalize_keyword(self, keyword):
+        """
+        规范化关键词：转换为小写、用空格替换连字符并单数化最后一个词
+        
+        结果缓存在有界的LRU缓存中，重复出现的关键词只需一次字典查找
+        
+        参数:
+            keyword (str): 原始关键词
+        
+        返回:
+            str: 规范化后的关键词
+        """
+        cache = self.normalization_cache
+        normalized = cache.get(keyword)
+        if normalized is not None:
+            cache.move_to_end(keyword)
+            self.normalization_hits += 1
+            return normalized
+        
+        self.normalization_misses += 1
+        normalized = self.singularize_keyword(keyword.lower())
+        cache[keyword] = normalized
+        if len(cache) > self.NORMALIZATION_CACHE_SIZE:
+            cache.popitem(last=False)
+        self._normalization_dirty = True
+        if self.learned_normalizations is not None:
+            self.learned_normalizations[keyword] = normalized
+        return normalized
+    
     def singularize_keyword(self, keyword):
         """
         将关键词短语的最后一个词转换为单数形式
@@ -17,7 +190,7 @@ class KeywordAnalyzer:
         
         参数:
             keyword (str): 要单数化的关键词短语
-            
+        
         返回:
             str: 单数化后的关键词短语
         """
@@ -27,13 +200,13 @@ class KeywordAnalyzer:
         words = keyword.split()
         if not words:
             return keyword
-            
+        
         # 仅将最后一个词单数化
         last_word = words[-1]
         singular_last_word = self.p.singular_noun(last_word)
         if singular_last_word:
             words[-1] = singular_last_word
-            
+        
         return ' '.join(words)
     
     def process_keywords(self, records):
@@ -41,70 +214,397 @@ class KeywordAnalyzer:
         处理记录中的关键词，转换为单数形式和小写
         
         参数:
-            records (list): 记录字典列表
-            
+            records (iterable): 记录字典列表，或 WoSFileParser.iter_records 产生的记录流
+        
+        返回:
+            KeywordMatrix: 关键词 × 年份的计数矩阵
+        """
+        return self.update_keywords({}, records)
+    
+    def update_keywords(self, keyword_stats, records, max_workers=None):
+        """
+        将新增记录的关键词累加到已有的统计中，已统计过的记录无需重新处理
+        
+        参数:
+            keyword_stats (KeywordMatrix or dict): 已有的关键词统计，不会被修改
+            records (iterable): 新增的记录
+            max_workers (int, optional): 分片规范化的进程数，默认不分片，见 _accumulate_keywords
+        
+        返回:
+            KeywordMatrix: 合并后的关键词 × 年份计数矩阵
+        """
+        if isinstance(keyword_stats, KeywordMatrix):
+            keyword_stats = keyword_stats.copy()
+        else:
+            keyword_stats = KeywordMatrix.from_dict(keyword_stats)
+        
+        return self._accumulate_keywords(keyword_stats, records, max_workers)
+    
+    def update_from_records(self, records, max_workers=None):
+        """
+        将记录列表中上次调用之后追加的记录累加到分析器保存的统计中
+        
+        解析器的记录列表只在末尾追加，分析器记住已统计的记录数，每次只处理新增的记录，
+        已统计的记录不会再次规范化或改写 'Keywords'。记录列表变短说明解析器已被重置，
+        此时重新统计
+        
+        参数:
+            records (list): 解析器的全部记录
+            max_workers (int, optional): 分片规范化的进程数，默认不分片，见 _accumulate_keywords
+        
         返回:
-            dict: 按年份组织的关键词统计
+            KeywordMatrix: 分析器保存的关键词统计（原地更新）
+        """
+        if len(records) < self.records_processed:
+            self.keyword_stats = KeywordMatrix()
+            self.records_processed = 0
+        
+        start = self.records_processed
+        self.records_processed = len(records)
+        return self._accumulate_keywords(self.keyword_stats, records, max_workers, start)
+    
+    def _accumulate_keywords(self, keyword_stats, records, max_workers=None, start=0):
+        """
+        将 records[start:] 的关键词原地累加到计数矩阵中
+        
+        规范化缓存命中时每个关键词只是一次字典查找，进程池的启动、传输和合并开销超过
+        子进程节省的时间，因此默认在当前进程中处理。只有调用者指定多个进程、记录保存在
+        RecordStore 中且新增记录不少于两个分片时才分片并行规范化，适合首次导入大量
+        缓存中没有的关键词，效果见 benchmarks/bench_keyword_normalization.py
         """
-        keyword_stats = defaultdict(lambda: defaultdict(int))
+        if (max_workers is not None and max_workers > 1 and isinstance(records, RecordStore)
+                and len(records) - start >= 2 * self.NORMALIZATION_SHARD_SIZE):
+            return self._accumulate_keywords_sharded(keyword_stats, records, start, max_workers)
+        if start:
+            records = records[start:]
+        
+        # 先收集每次出现的行号和列号，最后一次性累加到矩阵中
+        rows = []
+        columns = []
+        hits = self.normalization_hits
+        misses = self.normalization_misses
         
         for record in records:
             if 'PY' not in record:
                 continue
-                
-            year = record['PY']
-            keywords = []
-            
-            # 处理DE关键词
-            if 'DE' in record:
-                de_text = record['DE']
-                de_keywords = [kw.strip() for kw in de_text.split(';') if kw.strip()]
-                for kw in de_keywords:
-                    processed_kw = self.singularize_keyword(kw.lower())
-                    keywords.append(processed_kw)
-                    keyword_stats[processed_kw][year] += 1
             
-            # 处理ID关键词
-            if 'ID' in record:
-                id_text = record['ID']
-                id_keywords = [kw.strip() for kw in id_text.split(';') if kw.strip()]
-                for kw in id_keywords:
-                    processed_kw = self.singularize_keyword(kw.lower())
-                    keywords.append(processed_kw)
-                    keyword_stats[processed_kw][year] += 1
+            year = keyword_stats.year_id(record['PY'])
+            keywords = self.record_keywords(record)
+            for keyword in keywords:
+                rows.append(keyword_stats.keyword_id(keyword))
+                columns.append(year)
             
             # 将处理后的关键词添加到记录中
             record['Keywords'] = keywords
         
-        return dict(keyword_stats)
+        keyword_stats.add_counts(rows, columns)
+        self.debug_info.append(
+            f"关键词规范化缓存: 命中 {self.normalization_hits - hits} 次，"
+            f"未命中 {self.normalization_misses - misses} 次")
+        self.save_normalization_table()
+        
+        return keyword_stats
+    
+    def _accumulate_keywords_sharded(self, keyword_stats, store, start, workers):
+        """
+        将 RecordStore 中从 start 开始的记录分片交给进程池规范化关键词，再按分片顺序合并
+        
+        子进程直接收到各分片的原始文本字节和 PY、DE、ID 列的偏移，自行解码；返回分片的
+        关键词表和计数数组，当前进程只需为分片关键词表中的每个关键词编号一次。按分片顺序
+        合并时关键词和年份的编号顺序与单进程处理相同，因此结果完全一致
+        """
+        size = self.NORMALIZATION_SHARD_SIZE
+        bounds = [(first, min(first + size, len(store))) for first in range(start, len(store), size)]
+        payloads = [(store.column_slices(('PY', 'DE', 'ID'), first, last), last - first)
+                    for first, last in bounds]
+        
+        rows = []
+        columns = []
+        counts = []
+        learned_count = 0
+        hits_before = self.normalization_hits
+        misses_before = self.normalization_misses
+        with ProcessPoolExecutor(max_workers=min(workers, len(bounds)),
+                                 initializer=_init_normalization_worker) as executor:
+            for first, result in zip((first for first, _ in bounds), executor.map(_normalize_shard, payloads)):
+                (years, vocabulary, keyword_ids, year_ids, shard_counts, shard_keywords,
+                 learned, hits, misses) = result
+                
+                # 分片编号到全局编号的映射
+                year_map = np.array([keyword_stats.year_id(year) for year in years], dtype=np.int64)
+                keyword_map = np.array([keyword_stats.keyword_id(keyword) for keyword in vocabulary],
+                                       dtype=np.int64)
+                if len(shard_counts):
+                    rows.append(keyword_map[keyword_ids])
+                    columns.append(year_map[year_ids])
+                    counts.append(shard_counts)
+                
+                # 将处理后的关键词添加到记录中
+                kept = [(row, keywords) for row, keywords in enumerate(shard_keywords, first)
+                        if keywords is not None]
+                store.set_extra('Keywords', (row for row, _ in kept), (keywords for _, keywords in kept))
+                
+                # 子进程新规范化的关键词合并到缓存中，下次导入时直接命中
+                cache = self.normalization_cache
+                for keyword, normalized in learned.items():
+                    if keyword not in cache:
+                        cache[keyword] = normalized
+                        learned_count += 1
+                while len(cache) > self.NORMALIZATION_CACHE_SIZE:
+                    cache.popitem(last=False)
+                self.normalization_hits += hits
+                self.normalization_misses += misses
+        
+        if learned_count:
+            self._normalization_dirty = True
+        if rows:
+            keyword_stats.add_counts(np.concatenate(rows), np.concatenate(columns), np.concatenate(counts))
+        else:
+            keyword_stats.add_counts([], [])
+        self.save_normalization_table()
+        self.debug_info.append(
+            f"关键词规范化: {len(store) - start} 条记录分为 {len(bounds)} 个分片，"
+            f"{min(workers, len(bounds))} 个进程，缓存新增 {learned_count} 条")
+        self.debug_info.append(
+            f"关键词规范化缓存: 命中 {self.normalization_hits - hits_before} 次，"
+            f"未命中 {self.normalization_misses - misses_before} 次")
+        
+        return keyword_stats
+    
+    def update_cooccurrence(self, records):
+        """
+        将记录列表中上次调用之后追加的记录加入关键词共现统计
+        
+        记录需要先经过 update_keywords 或 update_from_records 写入 'Keywords'
+        
+        参数:
+            records (list): 解析器的全部记录
+        
+        返回:
+            KeywordCooccurrence: 分析器保存的共现统计
+        """
+        if len(records) < self.cooccurrence_records:
+            self.cooccurrence = KeywordCooccurrence()
+            self.cooccurrence_records = 0
+        
+        added = self.cooccurrence.add_records(records[self.cooccurrence_records:])
+        self.cooccurrence_records = len(records)
+        self.debug_info.append(
+            f"关键词共现: 新增 {added} 条记录，共 {len(self.cooccurrence.years)} 条记录、"
+            f"{len(self.cooccurrence.keywords)} 个关键词")
+        return self.cooccurrence
+    
+    def analyze_trends(self, keyword_stats, recent_years=None):
+        """
+        计算每个关键词的斜率、增长率和突发度
+        
+        参数:
+            keyword_stats (KeywordMatrix or dict): 关键词统计
+            recent_years (int, optional): 视为"最近"的年份数，默认为 TREND_RECENT_YEARS
+        
+        返回:
+            KeywordTrends: 趋势指标，ranking() 给出新兴关键词的排序
+        """
+        if not isinstance(keyword_stats, KeywordMatrix):
+            keyword_stats = KeywordMatrix.from_dict(keyword_stats)
+        
+        trends = KeywordTrends(keyword_stats, recent_years or self.TREND_RECENT_YEARS)
+        self.debug_info.append(
+            f"关键词趋势: {len(keyword_stats)} 个关键词，{len(trends.years)} 个年份，"
+            f"最近 {trends.recent_years} 年")
+        return trends
+    
+    def record_keywords(self, record):
+        """
+        取出一条记录的DE和ID关键词并规范化
+        
+        参数:
+            record (dict): 记录字典
+        
+        返回:
+            list: 规范化后的关键词，DE关键词在前
+        """
+        keywords = []
+        for tag in ('DE', 'ID'):
+            if tag in record:
+                for kw in record[tag].split(';'):
+                    kw = kw.strip()
+                    if kw:
+                        keywords.append(self.normalize_keyword(kw))
+        return keywords
+    
+    def sketch_keywords(self, records, capacity=None):
+        """
+        以固定内存近似统计记录流中的关键词
+        
+        不保存记录，也不写入 'Keywords'，适合直接消费解析器的记录流。
+        结果的误差范围见 KeywordSketch.error_bound
+        
+        参数:
+            records (iterable): 记录流，例如 WoSFileParser.iter_records 的结果
+            capacity (int, optional): 每个摘要监视的关键词数，默认为 SKETCH_CAPACITY
+        
+        返回:
+            KeywordSketch: 按年份的近似关键词统计
+        """
+        sketch = KeywordSketch(capacity or self.SKETCH_CAPACITY)
+        hits = self.normalization_hits
+        misses = self.normalization_misses
+        
+        for record in records:
+            if 'PY' not in record:
+                continue
+            
+            year = record['PY']
+            for keyword in self.record_keywords(record):
+                sketch.add(keyword, year)
+        
+        self.debug_info.append(
+            f"近似关键词统计: {sketch.total} 次出现，{len(sketch.by_year)} 个年份，"
+            f"总次数最大误差 {sketch.error_bound()}")
+        self.debug_info.append(
+            f"关键词规范化缓存: 命中 {self.normalization_hits - hits} 次，"
+            f"未命中 {self.normalization_misses - misses} 次")
+        self.save_normalization_table()
+        
+        return sketch
     
-    def group_similar_keywords(self, keyword_stats, threshold=80):
+    def sketch_files(self, file_parser, filepaths, capacity=None):
+        """
+        逐条读取文件中的记录并近似统计关键词，记录不进入解析器的记录列表
+        
+        与解析器导入时一样按 record_key 跳过重复的记录（文件之间重叠或同一文件出现多次），
+        去重键集合的大小随不同记录数增长，每条记录约几十字节
+        
+        参数:
+            file_parser (WoSFileParser): 用于读取记录的解析器
+            filepaths (list): 文件路径列表
+            capacity (int, optional): 每个摘要监视的关键词数
+        
+        返回:
+            KeywordSketch: 按年份的近似关键词统计
+        """
+        fields = self.REQUIRED_FIELDS | file_parser.DEDUP_FIELDS
+        seen_keys = set()
+        duplicates = 0
+        
+        def unique_records():
+            nonlocal duplicates
+            for filepath in filepaths:
+                for record in file_parser.iter_records(filepath, fields=fields):
+                    key = file_parser.record_key(record)
+                    if key is not None:
+                        if key in seen_keys:
+                            duplicates += 1
+                            continue
+                        seen_keys.add(key)
+                    yield record
+        
+        sketch = self.sketch_keywords(unique_records(), capacity)
+        if duplicates:
+            self.debug_info.append(f"近似关键词统计: 跳过 {duplicates} 条重复记录")
+        return sketch
+    
+    def group_similar_keywords(self, keyword_stats, threshold=80, method='fuzzy', max_workers=None,
+                               progress=None, cancel_event=None):
         """
         将相似的关键词分组
         
         参数:
-            keyword_stats (dict): 关键词统计数据
+            keyword_stats (dict or list): 关键词统计数据或关键词列表，只使用其中的关键词
             threshold (int): 相似度阈值(0-100)
-            
+            method (str): 相似度计算方法，'fuzzy'、'tfidf' 或 'cluster'
+            max_workers (int, optional): fuzzy 方法的最大进程数，默认为CPU核心数
+            progress (callable, optional): 进度回调 progress(已处理数, 总数, 获取当前分组的函数)
+            cancel_event (threading.Event, optional): 被设置后停止分组，返回已得到的分组
+        
         返回:
             list: 每个组是一个包含相似关键词的列表
         """
-        keywords = list(keyword_stats.keys())
+        if method == 'cluster':
+            return self.cluster_keywords(keyword_stats, threshold, progress, cancel_event)
+        
+        keywords = list(keyword_stats)
         groups = []
         used = set()
+        position = 0
         
-        for keyword in keywords:
-            if keyword in used:
-                continue
+        def advance(lookup):
+            """按原顺序贪心分组，直到遇到还没有求出相似关键词的关键词"""
+            nonlocal position
+            while position < len(keywords):
+                if cancel_event is not None and cancel_event.is_set():
+                    return
                 
-            # 找出相似和未使用的关键词
-            similar = process.extract(keyword, keywords, scorer=fuzz.token_sort_ratio)
-            similar_keywords = [k for k, score in similar if score >= threshold and k not in used]
-            
-            if similar_keywords:
-                groups.append(similar_keywords)
-                used.update(similar_keywords)
+                keyword = keywords[position]
+                if keyword not in used:
+                    # 找出相似和未使用的关键词
+                    similar = lookup(keyword)
+                    if similar is None:
+                        return
+                    similar_keywords = [k for k, score in similar if k not in used]
+                    
+                    if similar_keywords:
+                        groups.append(similar_keywords)
+                        used.update(similar_keywords)
                 
+                position += 1
+                if progress is not None:
+                    progress(position, len(keywords), lambda: groups)
+        
+        if method == 'tfidf':
+            # 分块稀疏矩阵乘法一次求出所有关键词的近邻
+            index = TfidfSimilarityIndex(keywords, self.TFIDF_CHUNK_SIZE)
+        elif method == 'fuzzy':
+            # 通过二元组倒排索引只比较可能相似的关键词，结果与逐一比较相同
+            index = KeywordSimilarityIndex(keywords)
+        else:
+            raise ValueError(f"未知的相似度计算方法: {method}")
+        
+        # 多进程求出每个关键词的相似关键词，它们与分组顺序无关；贪心分组仍在当前进程中
+        # 按原顺序进行，每完成一块就推进到第一个还没有结果的关键词，结果与单进程相同
+        workers = max_workers or os.cpu_count() or 1
+        if method == 'tfidf':
+            # 每算完一块稀疏矩阵乘法就推进分组，块之间响应取消
+            index.extract_all(threshold, callback=lambda results: advance(results.get),
+                              cancel_event=cancel_event)
+        elif method == 'fuzzy' and workers > 1 and len(keywords) >= self.PARALLEL_MIN_KEYWORDS:
+            index.extract_parallel(keywords, threshold, max_workers=workers,
+                                   callback=lambda results: advance(results.get),
+                                   cancel_event=cancel_event)
+        else:
+            advance(lambda keyword: index.extract(keyword, threshold))
+        
+        return groups
+    
+    def cluster_keywords(self, keyword_stats, threshold=80, progress=None, cancel_event=None):
+        """
+        对关键词增量聚类，组内任意两个关键词都达到阈值
+        
+        阈值不变时只将上次聚类之后新出现的关键词加入聚类，
+        阈值改变或关键词统计数据被替换时重新聚类
+        
+        参数:
+            keyword_stats (dict or list): 关键词统计数据或关键词列表，只使用其中的关键词
+            threshold (int): 相似度阈值(0-100)
+            progress (callable, optional): 进度回调 progress(已处理数, 总数, 获取当前分组的函数)
+            cancel_event (threading.Event, optional): 被设置后停止聚类，未比较的关键词留到下次
+        
+        返回:
+            list: 每个组是一个包含相似关键词的列表
+        """
+        clusterer = self.keyword_clusterer
+        known = set(keyword_stats)
+        if (clusterer is None or clusterer.threshold != threshold
+                or any(keyword not in known for keyword in clusterer.keywords)):
+            clusterer = self.keyword_clusterer = KeywordClusterer(threshold)
+        
+        comparisons = clusterer.comparisons
+        added = clusterer.add(keyword_stats, progress, cancel_event)
+        groups = clusterer.groups()
+        self.debug_info.append(
+            f"关键词聚类: 新增 {added} 个关键词，比较 {clusterer.comparisons - comparisons} 次，"
+            f"共 {len(groups)} 组")
         return groups
     
     def get_debug_info(self):
@@ -113,4 +613,9 @@ class KeywordAnalyzer:
     
     def reset(self):
         """重置分析器状态"""
-        self.debug_info = []
\ No newline at end of file
+        self.debug_info = []
+        self.keyword_clusterer = None
+        self.keyword_stats = KeywordMatrix()
+        self.records_processed = 0
+        self.cooccurrence = KeywordCooccurrence()
+        self.cooccurrence_records = 0
\ No newline at end of file
@@ -0,0 +1,181 @@
+"""
+关键词共现矩阵与网络导出
+
+每条有年份的记录是记录 × 关键词关联矩阵中的一行，记录中出现的关键词对应的列为1。
+共现次数矩阵由一次稀疏矩阵乘法 X^T X 得到，按年份范围切片时只取出对应的行再相乘。
+导出时用 argpartition 选出权重最高的边，按块写入文件，边始终保存在 NumPy 数组中，
+不会展开成 Python 元组列表
+"""
+
+import csv
+import os
+from array import array
+import numpy as np
+from scipy import sparse
+
+class KeywordCooccurrence:
+    """关键词共现统计，记录可以分批追加"""
+    
+    # 写入文件时每块的边数
+    WRITE_CHUNK_SIZE = 50000
+    
+    # 支持的导出格式：Gephi 的边表CSV，或 VOSviewer 的网络文件和地图文件
+    EXPORT_FORMATS = ('gephi', 'vosviewer')
+    
+    def __init__(self):
+        self.keywords = []
+        self._keyword_ids = {}
+        self.years = []
+        self._indices = array('q')
+        self._indptr = array('q', [0])
+        self._incidence = None
+    
+    def add_records(self, records):
+        """
+        将记录加入关联矩阵，记录中的 'Keywords' 由 KeywordAnalyzer 写入
+        
+        参数:
+            records (iterable): 记录字典列表
+        
+        返回:
+            int: 加入的记录数
+        """
+        added = 0
+        for record in records:
+            keywords = record.get('Keywords')
+            if 'PY' not in record or not keywords:
+                continue
+            
+            # 同一记录中重复的关键词只算一次
+            row = set()
+            for keyword in keywords:
+                keyword_id = self._keyword_ids.get(keyword)
+                if keyword_id is None:
+                    keyword_id = self._keyword_ids[keyword] = len(self.keywords)
+                    self.keywords.append(keyword)
+                row.add(keyword_id)
+            
+            self._indices.extend(sorted(row))
+            self._indptr.append(len(self._indices))
+            self.years.append(record['PY'])
+            added += 1
+        
+        if added:
+            self._incidence = None
+        return added
+    
+    def incidence(self):
+        """返回记录 × 关键词的CSR关联矩阵"""
+        if self._incidence is None:
+            indices = np.frombuffer(self._indices, dtype=np.int64)
+            indptr = np.frombuffer(self._indptr, dtype=np.int64)
+            data = np.ones(len(indices), dtype=np.int32)
+            self._incidence = sparse.csr_matrix((data, indices, indptr),
+                                                shape=(len(self.years), len(self.keywords)))
+        return self._incidence
+    
+    def matrix(self, start_year=None, end_year=None):
+        """
+        计算关键词共现次数矩阵
+        
+        参数:
+            start_year (str, optional): 起始年份（含）
+            end_year (str, optional): 结束年份（含）
+        
+        返回:
+            scipy.sparse.csr_matrix: 关键词 × 关键词的共现次数，只保留上三角（不含对角线）
+        """
+        incidence = self.incidence()
+        if start_year is not None or end_year is not None:
+            years = np.array(self.years)
+            selected = np.ones(len(years), dtype=bool)
+            if start_year is not None:
+                selected &= years >= str(start_year)
+            if end_year is not None:
+                selected &= years <= str(end_year)
+            incidence = incidence[np.flatnonzero(selected)]
+        
+        product = (incidence.T @ incidence).tocsr()
+        return sparse.triu(product, k=1, format='csr')
+    
+    def top_edges(self, limit=None, start_year=None, end_year=None, min_weight=1):
+        """
+        选出共现次数最高的边
+        
+        参数:
+            limit (int, optional): 边数上限，None表示全部
+            start_year (str, optional): 起始年份（含）
+            end_year (str, optional): 结束年份（含）
+            min_weight (int): 最小共现次数
+        
+        返回:
+            tuple: (源关键词编号数组, 目标关键词编号数组, 共现次数数组)，按次数从高到低排列
+        """
+        edges = self.matrix(start_year, end_year).tocoo()
+        keep = np.flatnonzero(edges.data >= min_weight)
+        if limit is not None and limit < len(keep):
+            keep = keep[np.argpartition(-edges.data[keep], limit - 1)[:limit]]
+        
+        sources, targets, weights = edges.row[keep], edges.col[keep], edges.data[keep]
+        order = np.lexsort((targets, sources, -weights))
+        return sources[order], targets[order], weights[order]
+    
+    def export_edges(self, filepath, file_format='gephi', limit=None, start_year=None, end_year=None,
+                     min_weight=1):
+        """
+        将共现网络导出为 Gephi 或 VOSviewer 可以读取的文件
+        
+        gephi 格式写入带 Source,Target,Weight,Type 表头的边表CSV；vosviewer 格式写入
+        制表符分隔的网络文件（编号1、编号2、权重），并在同目录写入同名加 _map 的地图文件
+        （编号、标签、出现次数）
+        
+        参数:
+            filepath (str): 输出文件路径
+            file_format (str): 'gephi' 或 'vosviewer'
+            limit (int, optional): 导出的边数上限
+            start_year (str, optional): 起始年份（含）
+            end_year (str, optional): 结束年份（含）
+            min_weight (int): 最小共现次数
+        
+        返回:
+            int: 导出的边数
+        """
+        if file_format not in self.EXPORT_FORMATS:
+            raise ValueError(f"未知的网络导出格式: {file_format}")
+        
+        sources, targets, weights = self.top_edges(limit, start_year, end_year, min_weight)
+        
+        if file_format == 'gephi':
+            with open(filepath, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(['Source', 'Target', 'Weight', 'Type'])
+                for start in range(0, len(weights), self.WRITE_CHUNK_SIZE):
+                    end = start + self.WRITE_CHUNK_SIZE
+                    writer.writerows(
+                        (self.keywords[source], self.keywords[target], weight, 'Undirected')
+                        for source, target, weight in zip(sources[start:end].tolist(),
+                                                          targets[start:end].tolist(),
+                                                          weights[start:end].tolist()))
+            return len(weights)
+        
+        # VOSviewer 的编号从1开始，地图文件只包含出现在边中的关键词
+        nodes = np.union1d(sources, targets)
+        node_ids = np.zeros(len(self.keywords), dtype=np.int64)
+        node_ids[nodes] = np.arange(1, len(nodes) + 1)
+        occurrences = np.asarray(self.incidence().sum(axis=0)).ravel()
+        
+        root, extension = os.path.splitext(filepath)
+        with open(root + '_map' + (extension or '.txt'), 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f, delimiter='\t', quoting=csv.QUOTE_MINIMAL)
+            writer.writerow(['id', 'label', 'weight<Occurrences>'])
+            writer.writerows((node_id, self.keywords[node], occurrence)
+                             for node_id, node, occurrence in zip(range(1, len(nodes) + 1), nodes.tolist(),
+                                                                  occurrences[nodes].tolist()))
+        
+        with open(filepath, 'w', encoding='utf-8', newline='') as f:
+            for start in range(0, len(weights), self.WRITE_CHUNK_SIZE):
+                end = start + self.WRITE_CHUNK_SIZE
+                block = np.column_stack((node_ids[sources[start:end]], node_ids[targets[start:end]],
+                                         weights[start:end]))
+                np.savetxt(f, block, fmt='%d', delimiter='\t')
+        return len(weights)
\ No newline at end of file
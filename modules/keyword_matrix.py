@@ -0,0 +1,202 @@
+"""
+关键词 × 年份的计数矩阵
+
+关键词统计原先是以关键词和年份字符串为键的嵌套字典，关键词表格、趋势图和导出
+各自重新收集年份并逐个关键词求和。KeywordMatrix 为关键词和年份分别编号，计数保存在
+NumPy 矩阵中，总数、前N名和按年份切片都是矩阵运算，由所有使用者共用。
+
+矩阵的存储按倍数扩容，累加时只更新涉及的单元格，因此每次追加记录的开销只与新增的
+关键词出现次数成正比，与已有的词表大小无关。
+
+KeywordMatrix 同时实现只读的 Mapping 接口，keyword_stats[keyword] 仍返回
+{年份: 次数} 字典，按字典使用关键词统计的代码无需修改
+"""
+
+from collections.abc import Mapping
+import numpy as np
+
+class KeywordMatrix(Mapping):
+    """关键词 × 年份的计数矩阵，行按关键词首次出现的顺序编号，列按年份首次出现的顺序编号"""
+    
+    def __init__(self):
+        self.keywords = []
+        self.years = []
+        self._keyword_ids = {}
+        self._year_ids = {}
+        self._storage = np.zeros((0, 0), dtype=np.int64)
+        self._totals = None
+    
+    @property
+    def counts(self):
+        """计数矩阵，形状为 (关键词数, 年份数)，是底层存储的视图"""
+        return self._storage[:len(self.keywords), :len(self.years)]
+    
+    @classmethod
+    def from_dict(cls, keyword_stats):
+        """
+        由嵌套字典形式的关键词统计创建计数矩阵
+        
+        参数:
+            keyword_stats (dict): {关键词: {年份: 次数}}
+        
+        返回:
+            KeywordMatrix: 计数矩阵
+        """
+        matrix = cls()
+        rows, columns, counts = [], [], []
+        for keyword, year_data in keyword_stats.items():
+            row = matrix.keyword_id(keyword)
+            for year, count in year_data.items():
+                rows.append(row)
+                columns.append(matrix.year_id(year))
+                counts.append(count)
+        matrix.add_counts(rows, columns, counts)
+        return matrix
+    
+    def copy(self):
+        """返回计数矩阵的副本"""
+        matrix = KeywordMatrix()
+        matrix.keywords = list(self.keywords)
+        matrix.years = list(self.years)
+        matrix._keyword_ids = dict(self._keyword_ids)
+        matrix._year_ids = dict(self._year_ids)
+        matrix._storage = self.counts.copy()
+        matrix._totals = self._totals
+        return matrix
+    
+    def keyword_id(self, keyword):
+        """返回关键词的行号，新关键词追加到词表末尾"""
+        row = self._keyword_ids.get(keyword)
+        if row is None:
+            row = self._keyword_ids[keyword] = len(self.keywords)
+            self.keywords.append(keyword)
+        return row
+    
+    def year_id(self, year):
+        """返回年份的列号，新年份追加到末尾"""
+        column = self._year_ids.get(year)
+        if column is None:
+            column = self._year_ids[year] = len(self.years)
+            self.years.append(year)
+        return column
+    
+    def add_counts(self, rows, columns, counts=None):
+        """
+        批量累加计数
+        
+        参数:
+            rows (list): 行号列表
+            columns (list): 与行号一一对应的列号列表
+            counts (list, optional): 每项的次数，默认为1
+        """
+        row_count, column_count = len(self.keywords), len(self.years)
+        capacity_rows, capacity_columns = self._storage.shape
+        if row_count > capacity_rows or column_count > capacity_columns:
+            # 按倍数扩容，逐次追加关键词时复制的总量与关键词数成正比
+            grown = np.zeros((max(row_count, 2 * capacity_rows), max(column_count, 2 * capacity_columns)),
+                             dtype=np.int64)
+            grown[:capacity_rows, :capacity_columns] = self._storage
+            self._storage = grown
+        if not len(rows):
+            return
+        
+        # 合并相同的单元格后只更新涉及的单元格
+        flat = np.asarray(rows, dtype=np.int64) * column_count + np.asarray(columns, dtype=np.int64)
+        cells, inverse = np.unique(flat, return_inverse=True)
+        weights = None if counts is None else np.asarray(counts, dtype=np.float64)
+        added = np.bincount(inverse, weights=weights).astype(np.int64)
+        self._storage[cells // column_count, cells % column_count] += added
+        self._totals = None
+    
+    def __getitem__(self, keyword):
+        values = self.counts[self._keyword_ids[keyword]]
+        return {self.years[column]: int(values[column]) for column in np.flatnonzero(values)}
+    
+    def __contains__(self, keyword):
+        return keyword in self._keyword_ids
+    
+    def __iter__(self):
+        return iter(self.keywords)
+    
+    def __len__(self):
+        return len(self.keywords)
+    
+    def totals(self):
+        """返回每个关键词的总次数数组"""
+        if self._totals is None:
+            self._totals = self.counts.sum(axis=1)
+        return self._totals
+    
+    def total(self, keyword):
+        """返回单个关键词的总次数，不存在的关键词为0"""
+        row = self._keyword_ids.get(keyword)
+        return 0 if row is None else int(self.totals()[row])
+    
+    def sorted_years(self):
+        """返回按字符串排序的年份列表"""
+        return sorted(self.years)
+    
+    def year_columns(self, years):
+        """返回年份对应的列号数组"""
+        return np.array([self._year_ids[year] for year in years], dtype=np.int64)
+    
+    def ranking(self):
+        """返回按总次数从高到低排列的行号，次数相同时保持关键词的原顺序"""
+        return np.argsort(-self.totals(), kind='stable')
+    
+    def top(self, n):
+        """
+        返回总次数最多的 n 个关键词的行号
+        
+        用 argpartition 找出第 n 名的次数，只对前 n 名排序，结果与 ranking()[:n] 相同
+        
+        参数:
+            n (int): 关键词数
+        
+        返回:
+            ndarray: 行号数组，按总次数从高到低排列
+        """
+        totals = self.totals()
+        if n >= len(totals):
+            return self.ranking()
+        if n <= 0:
+            return np.zeros(0, dtype=np.int64)
+        
+        # 次数高于第 n 名的全部入选，与第 n 名次数相同的按原顺序补足
+        kth = totals[np.argpartition(-totals, n - 1)[n - 1]]
+        above = np.flatnonzero(totals > kth)
+        ties = np.flatnonzero(totals == kth)[:n - len(above)]
+        selected = np.concatenate([above, ties])
+        return selected[np.lexsort((selected, -totals[selected]))]
+    
+    def year_slice(self, row_ids, years):
+        """
+        按行号和年份取出子矩阵
+        
+        参数:
+            row_ids (array-like): 行号，例如 ranking() 或 top() 的结果
+            years (list): 年份列表
+        
+        返回:
+            ndarray: 形状为 (行数, 年份数) 的计数矩阵
+        """
+        return self.counts[np.ix_(np.asarray(row_ids, dtype=np.int64), self.year_columns(years))]
+    
+    def rows(self, keywords, years):
+        """
+        取出若干关键词在若干年份的计数
+        
+        参数:
+            keywords (list): 关键词列表，不存在的关键词计数为0
+            years (list): 年份列表
+        
+        返回:
+            ndarray: 形状为 (关键词数, 年份数) 的计数矩阵
+        """
+        ids = [self._keyword_ids.get(keyword, -1) for keyword in keywords]
+        known = np.array([row >= 0 for row in ids], dtype=bool)
+        result = np.zeros((len(ids), len(years)), dtype=np.int64)
+        if known.any():
+            rows = np.array(ids, dtype=np.int64)[known]
+            result[known] = self.year_slice(rows, years)
+        return result
\ No newline at end of file
@@ -0,0 +1,668 @@
+"""
+关键词相似度的候选索引
+
+group_similar_keywords 原先对每个关键词调用 process.extract 与全部关键词比较，
+比较次数随关键词数平方增长。token_sort_ratio 实际比较的是规范化并排序后的词串，
+这里为每个关键词预先计算该词串，并建立字符二元组（q=2）倒排索引。
+
+两个词串的 ratio 不超过 2*LCS/(la+lb)，由此可以得到候选的长度范围、两者至少共有的
+二元组数，以及由公共字符数给出的得分上界。只有满足这些必要条件的候选才真正计算
+得分，因此达到阈值的结果与逐一比较完全相同，而大部分不可能相似的关键词在计算
+得分之前就被排除。
+
+关键词较多时，extract_parallel 将关键词分块交给进程池，每个子进程用 rapidfuzz 的
+cdist 一次算出整块关键词与全部词串的 Indel 相似度。它不低于 fuzzywuzzy 的得分，只用作
+候选的得分上界，最终得分仍由 fuzz.ratio 计算，因此结果与单进程相同。
+
+KeywordClusterer 是持久的增量聚类：组内任意两个关键词的得分都达到阈值（全连接），
+新关键词只加入与全部成员都相似的组，不会经由一串两两相似的关键词把不相关的词连成一组。
+每次导入后只将新出现的关键词与已有关键词比较，已有的分组保持不变。
+
+另一种方法 TfidfSimilarityIndex 将关键词向量化为字符 n-gram 的 TF-IDF 稀疏矩阵，
+以余弦相似度作为得分，通过分块的稀疏矩阵乘法一次求出所有关键词的近邻
+"""
+
+import os
+import math
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+from scipy import sparse
+from fuzzywuzzy import fuzz, utils
+from rapidfuzz import fuzz as rapid_fuzz, process as rapid_process
+
+# 倒排索引使用的字符 q-gram 长度
+Q = 2
+
+# 字符计数矩阵的列数，最常见的字符各占一列，其余字符共用最后一列
+CHAR_BUCKETS = 64
+
+# extract_many 每次 cdist 的查询词串数，用于限制得分矩阵的内存占用
+CDIST_BATCH_SIZE = 128
+
+# 子进程中的索引，由进程池初始化时传入
+_worker_index = None
+
+def token_sort_key(text, query=False):
+    """
+    计算 process.extract 使用 token_sort_ratio 时实际参与比较的排序词串
+    
+    参数:
+        text (str): 关键词
+        query (bool): 是否为查询词（process.extract 会对查询词额外规范化一次）
+    
+    返回:
+        str: 规范化后按词排序的字符串
+    """
+    if query:
+        text = utils.full_process(text)
+    processed = utils.full_process(text, force_ascii=True)
+    return ' '.join(sorted(processed.split())).strip()
+
+def _qgrams(key):
+    """统计词串中每个 q-gram 的出现次数"""
+    return Counter(key[i:i + Q] for i in range(len(key) - Q + 1))
+
+def _init_worker(index):
+    """进程池初始化函数，每个子进程只接收一次索引"""
+    global _worker_index
+    _worker_index = index
+
+def _extract_block(keywords, threshold, limit):
+    """在子进程中查找一块关键词的相似关键词"""
+    return _worker_index.extract_many(keywords, threshold, limit)
+
+class KeywordSimilarityIndex:
+    """
+    关键词的二元组倒排索引，用于快速查找与某个关键词相似的关键词
+    
+    extract(keyword, threshold) 的结果与
+    process.extract(keyword, keywords, scorer=fuzz.token_sort_ratio, limit=limit)
+    中得分不低于 threshold 的部分相同
+    """
+    
+    def __init__(self, keywords):
+        self.keywords = list(keywords)
+        
+        # 排序词串相同的关键词得分完全相同，只需为每个不同的词串计算一次
+        self.keys = []
+        self._key_ids = {}
+        self._members = []
+        for index, keyword in enumerate(self.keywords):
+            key = token_sort_key(keyword)
+            key_id = self._key_ids.get(key)
+            if key_id is None:
+                key_id = self._key_ids[key] = len(self.keys)
+                self.keys.append(key)
+                self._members.append([])
+            self._members[key_id].append(index)
+        
+        self._lengths = np.array([len(key) for key in self.keys], dtype=np.int64)
+        self._by_length = defaultdict(list)
+        for key_id, key in enumerate(self.keys):
+            self._by_length[len(key)].append(key_id)
+        
+        # 二元组 -> (词串编号数组, 出现次数数组)
+        postings = defaultdict(lambda: ([], []))
+        for key_id, key in enumerate(self.keys):
+            for gram, count in _qgrams(key).items():
+                key_ids, counts = postings[gram]
+                key_ids.append(key_id)
+                counts.append(count)
+        self._postings = {gram: (np.array(key_ids, dtype=np.int64), np.array(counts, dtype=np.int64))
+                          for gram, (key_ids, counts) in postings.items()}
+        
+        # 每个词串的字符计数，几个字符共用一列时公共字符数只会偏大，仍是有效的上界
+        char_frequency = Counter()
+        for key in self.keys:
+            char_frequency.update(key)
+        self._char_columns = {char: column for column, (char, _) in
+                              enumerate(char_frequency.most_common(CHAR_BUCKETS - 1))}
+        self._char_counts = np.array([self._char_vector(key) for key in self.keys],
+                                     dtype=np.int32).reshape(len(self.keys), CHAR_BUCKETS)
+        
+        # 查询词串和参数 -> 结果，同一词串的关键词共用
+        self._results = {}
+    
+    def _char_vector(self, key):
+        """统计词串在每个字符列中的字符数"""
+        vector = [0] * CHAR_BUCKETS
+        for char in key:
+            vector[self._char_columns.get(char, CHAR_BUCKETS - 1)] += 1
+        return vector
+    
+    def _required_common(self, query_length, threshold):
+        """
+        计算每种候选长度至少需要的公共二元组数
+        
+        参数:
+            query_length (int): 查询词串的长度
+            threshold (int): 相似度阈值
+        
+        返回:
+            dict: 候选长度 -> 公共二元组数下界；不可能达到阈值的长度不出现
+        """
+        min_ratio = (threshold - 0.5) / 100 - 1e-9
+        la = query_length
+        required = {}
+        for lb in self._by_length:
+            if lb == 0 or 2 * min(la, lb) < min_ratio * (la + lb):
+                continue
+            
+            # 得分达到阈值时最长公共子序列的最小长度；每个未匹配的字符最多破坏
+            # 本串中 Q 个二元组，另一串中的每处插入最多破坏 Q-1 个
+            lcs = math.ceil(min_ratio * (la + lb) / 2)
+            required[lb] = max(la - Q + 1 - Q * (la - lcs) - (Q - 1) * (lb - lcs),
+                               lb - Q + 1 - Q * (lb - lcs) - (Q - 1) * (la - lcs))
+        return required
+    
+    def _candidates(self, query_key, threshold):
+        """
+        查找可能达到阈值的候选词串
+        
+        参数:
+            query_key (str): 查询词串
+            threshold (int): 相似度阈值
+        
+        返回:
+            tuple: (候选词串编号数组, 对应的得分上界数组)
+        """
+        if not self.keys or threshold <= 0:
+            candidates = np.arange(len(self.keys))
+            return candidates, np.full(len(candidates), 100)
+        if not query_key:
+            # 空词串只与空词串相同（得分100），与其他词串得分为0
+            candidates = np.array(self._by_length.get(0, []), dtype=np.int64)
+            return candidates, np.full(len(candidates), 100)
+        
+        # 长度范围之外的词串不可能达到阈值，其余长度要求的公共二元组数可能为0
+        needed = np.full(int(self._lengths.max()) + 1, np.iinfo(np.int64).max, dtype=np.int64)
+        for length, count in self._required_common(len(query_key), threshold).items():
+            needed[length] = max(count, 0)
+        
+        # 累加与每个词串的公共二元组数
+        common = np.zeros(len(self.keys), dtype=np.int64)
+        for gram, count in _qgrams(query_key).items():
+            posting = self._postings.get(gram)
+            if posting is not None:
+                key_ids, counts = posting
+                common[key_ids] += np.minimum(counts, count)
+        candidates = np.flatnonzero(common >= needed[self._lengths])
+        
+        # 公共字符数给出得分上界 round(100*2*公共字符数/(la+lb))，它也必须达到阈值
+        query_chars = np.array(self._char_vector(query_key), dtype=np.int32)
+        common_chars = np.minimum(self._char_counts[candidates], query_chars).sum(axis=1)
+        total_lengths = self._lengths[candidates] + len(query_key)
+        bounds = np.floor(200 * common_chars / total_lengths + 0.5 + 1e-9).astype(np.int64)
+        possible = bounds >= threshold
+        return candidates[possible], bounds[possible]
+    
+    def extract(self, keyword, threshold, limit=5):
+        """
+        查找与关键词相似的关键词
+        
+        参数:
+            keyword (str): 查询关键词
+            threshold (int): 相似度阈值(0-100)
+            limit (int): 与 process.extract 相同的返回数量上限
+        
+        返回:
+            list: (关键词, 得分) 列表，按得分从高到低、得分相同时按原顺序排列，
+                  只包含前 limit 个结果中得分不低于阈值的关键词
+        """
+        if limit <= 0:
+            return []
+        
+        query_key = token_sort_key(keyword, query=True)
+        cache_key = (query_key, threshold, limit)
+        result = self._results.get(cache_key)
+        if result is not None:
+            return result
+        
+        candidates, bounds = self._candidates(query_key, threshold)
+        result = self._score(query_key, candidates, bounds, threshold, limit)
+        self._results[cache_key] = result
+        return result
+    
+    def extract_many(self, keywords, threshold, limit=5):
+        """
+        批量查找多个关键词的相似关键词
+        
+        用 rapidfuzz 的 cdist 一次算出一批查询词串与全部词串的 Indel 相似度作为得分上界，
+        代替逐个查询时的二元组筛选，结果与逐个调用 extract 相同
+        
+        参数:
+            keywords (list): 查询关键词列表
+            threshold (int): 相似度阈值(0-100)
+            limit (int): 与 process.extract 相同的返回数量上限
+        
+        返回:
+            list: 与 keywords 一一对应的 extract 结果
+        """
+        query_keys = [token_sort_key(keyword, query=True) for keyword in keywords]
+        
+        # 阈值为0或查询词串为空时没有可用的上界，仍由 extract 处理
+        if threshold > 0 and limit > 0:
+            pending = [key for key in dict.fromkeys(query_keys)
+                       if key and (key, threshold, limit) not in self._results]
+            
+            # 舍入后达到阈值的得分不低于 threshold-0.5，留出浮点误差的余量
+            cutoff = threshold - 0.5 - 1e-4
+            for start in range(0, len(pending), CDIST_BATCH_SIZE):
+                batch = pending[start:start + CDIST_BATCH_SIZE]
+                scores = rapid_process.cdist(batch, self.keys, scorer=rapid_fuzz.ratio,
+                                             score_cutoff=cutoff, dtype=np.float32, workers=1)
+                for query_key, row in zip(batch, scores):
+                    candidates = np.flatnonzero(row >= cutoff)
+                    bounds = np.floor(row[candidates] + 0.5 + 1e-4).astype(np.int64)
+                    self._results[(query_key, threshold, limit)] = self._score(
+                        query_key, candidates, bounds, threshold, limit)
+        
+        return [self.extract(keyword, threshold, limit) for keyword in keywords]
+    
+    def extract_parallel(self, keywords, threshold, limit=5, max_workers=None, block_size=500,
+                         callback=None, cancel_event=None):
+        """
+        使用进程池查找所有关键词的相似关键词
+        
+        参数:
+            keywords (list): 查询关键词列表
+            threshold (int): 相似度阈值(0-100)
+            limit (int): 与 process.extract 相同的返回数量上限
+            max_workers (int, optional): 最大进程数，默认为CPU核心数
+            block_size (int): 每个任务的关键词数
+            callback (callable, optional): 每完成一块后以目前的结果字典调用
+            cancel_event (threading.Event, optional): 被设置后取消尚未开始的任务
+        
+        返回:
+            dict: 关键词 -> extract 结果，取消时只包含已完成的块
+        """
+        keywords = list(dict.fromkeys(keywords))
+        blocks = [keywords[start:start + block_size] for start in range(0, len(keywords), block_size)]
+        if not blocks:
+            return {}
+        
+        results = {}
+        with ProcessPoolExecutor(max_workers=min(max_workers or os.cpu_count() or 1, len(blocks)),
+                                 initializer=_init_worker, initargs=(self,)) as executor:
+            futures = {executor.submit(_extract_block, block, threshold, limit): block
+                       for block in blocks}
+            for future in as_completed(futures):
+                results.update(zip(futures[future], future.result()))
+                if callback is not None:
+                    callback(results)
+                if cancel_event is not None and cancel_event.is_set():
+                    for pending in futures:
+                        pending.cancel()
+                    break
+        return results
+    
+    def _score(self, query_key, candidates, bounds, threshold, limit):
+        """
+        计算候选的得分并取前 limit 个
+        
+        参数:
+            query_key (str): 查询词串
+            candidates (ndarray): 候选词串编号
+            bounds (ndarray): 对应的得分上界
+            threshold (int): 相似度阈值
+            limit (int): 返回数量上限
+        
+        返回:
+            list: (关键词, 得分) 列表
+        """
+        # 按得分上界从高到低计算得分，剩余候选的上界低于当前第 limit 名的得分时停止
+        matches = []
+        for position in np.argsort(-bounds, kind='stable'):
+            if len(matches) >= limit and bounds[position] < -matches[limit - 1][0]:
+                break
+            
+            key_id = candidates[position]
+            score = fuzz.ratio(query_key, self.keys[key_id])
+            if score >= threshold:
+                matches.extend((-score, index) for index in self._members[key_id])
+                matches.sort()
+                del matches[limit:]
+        
+        return [(self.keywords[index], -score) for score, index in matches]
+
+class KeywordClusterer:
+    """
+    关键词的增量全连接聚类，用并查集记录每个关键词所属的组
+    
+    新关键词按加入顺序与已分组的关键词比较，只能加入与组内每个成员的 token_sort_ratio
+    都不低于阈值的组，有多个这样的组时加入平均得分最高的组，否则自成一组。
+    只按两两相似合并（单连接）时，A~B、B~C 会把互不相似的 A 和 C 连到一起，
+    一串这样的关键词可以连成包含大量无关关键词的组。与贪心分组一样，先加入的关键词先成组；
+    新关键词加入时只与已有关键词比较，已有的分组保持不变
+    """
+    
+    def __init__(self, threshold=80):
+        self.threshold = threshold
+        self.keywords = []
+        self.keys = []
+        self._ids = {}
+        self._parent = []
+        self._size = []
+        
+        # 每个不同的非空排序词串只保留一个代表参与比较，相同词串的关键词直接合并
+        self._representatives = {}
+        self._representative_ids = []
+        self._representative_keys = []
+        
+        # 组的根节点 -> 组内的代表节点，按加入顺序排列
+        self._members = {}
+        
+        # 还没有与其他关键词比较过的代表节点，比较被取消时留到下次 add
+        self._pending = []
+        
+        # 实际调用 fuzz.ratio 的次数
+        self.comparisons = 0
+    
+    def __len__(self):
+        return len(self.keywords)
+    
+    def __contains__(self, keyword):
+        return keyword in self._ids
+    
+    def find(self, node):
+        """查找节点所在分量的根节点"""
+        parent = self._parent
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+    
+    def union(self, a, b):
+        """合并两个节点所在的分量，返回是否发生了合并"""
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if self._size[a] < self._size[b]:
+            a, b = b, a
+        self._parent[b] = a
+        self._size[a] += self._size[b]
+        if b in self._members:
+            self._members.setdefault(a, []).extend(self._members.pop(b))
+        return True
+    
+    def add(self, keywords, progress=None, cancel_event=None):
+        """
+        加入新关键词，并与已有的和同批加入的关键词比较
+        
+        参数:
+            keywords (iterable): 关键词，已加入的关键词会被忽略
+            progress (callable, optional): 每比较完一批后调用 progress(已比较数, 总数, groups)
+            cancel_event (threading.Event, optional): 被设置后停止比较，剩余的关键词留到下次 add
+        
+        返回:
+            int: 新加入的关键词数
+        """
+        first_new = len(self.keywords)
+        pending = self._pending
+        for keyword in keywords:
+            if keyword in self._ids:
+                continue
+            node = self._ids[keyword] = len(self.keywords)
+            key = token_sort_key(keyword)
+            self.keywords.append(keyword)
+            self.keys.append(key)
+            self._parent.append(node)
+            self._size.append(1)
+            
+            # 空词串与任何词串的得分都是0，单独成组
+            if not key:
+                continue
+            representative = self._representatives.get(key)
+            if representative is None:
+                self._representatives[key] = node
+                self._representative_ids.append(node)
+                self._representative_keys.append(key)
+                self._members[node] = [node]
+                pending.append(node)
+            else:
+                self.union(representative, node)
+        
+        # 用 Indel 相似度（不低于 fuzz.ratio）筛选候选，再计算准确得分
+        cutoff = self.threshold - 0.5 - 1e-4
+        total = len(pending)
+        while pending:
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            
+            batch = pending[:CDIST_BATCH_SIZE]
+            scores = rapid_process.cdist([self.keys[node] for node in batch], self._representative_keys,
+                                         scorer=rapid_fuzz.ratio, score_cutoff=cutoff,
+                                         dtype=np.float32, workers=-1)
+            for node, row in zip(batch, scores):
+                matched = {}
+                for column in np.flatnonzero(row >= cutoff):
+                    other = self._representative_ids[column]
+                    
+                    # 只与已分组的代表比较，之后的代表分组时再与本节点比较
+                    if other >= node:
+                        continue
+                    
+                    # fuzz.ratio 不一定对称，按词串顺序比较使得分与比较方向无关
+                    a, b = sorted((self.keys[node], self.keys[other]))
+                    self.comparisons += 1
+                    score = fuzz.ratio(a, b)
+                    if score >= self.threshold:
+                        matched[other] = score
+                
+                # 在与全部成员都相似的组中选平均得分最高的，相同时选较早的组
+                best = None
+                for root in {self.find(other) for other in matched}:
+                    members = self._members[root]
+                    if all(member in matched for member in members):
+                        rank = (-sum(matched[member] for member in members) / len(members), members[0])
+                        if best is None or rank < best[0]:
+                            best = (rank, root)
+                if best is not None:
+                    self.union(best[1], node)
+            
+            del pending[:len(batch)]
+            if progress is not None:
+                progress(total - len(pending), total, self.groups)
+        
+        return len(self.keywords) - first_new
+    
+    def groups(self):
+        """
+        获取当前的分组
+        
+        返回:
+            list: 每个组是一个关键词列表，组按最早加入的成员排列，组内按加入顺序排列
+        """
+        members = defaultdict(list)
+        for node, keyword in enumerate(self.keywords):
+            members[self.find(node)].append(keyword)
+        return list(members.values())
+
+class TfidfSimilarityIndex:
+    """
+    关键词的字符 n-gram TF-IDF 向量索引
+    
+    关键词词表一次性向量化为稀疏矩阵，每行经L2归一化，两行的点积即余弦相似度。
+    所有关键词的近邻由分块的稀疏矩阵乘法求出，每块只保留得分达到阈值的前 limit 个，
+    不在Python中逐对计算得分。chunk_size 限制每次乘法的行数，从而限制中间结果的内存
+    """
+    
+    # 字符 n-gram 的长度
+    NGRAM = 3
+    
+    def __init__(self, keywords, chunk_size=256):
+        self.keywords = list(keywords)
+        self.chunk_size = max(1, chunk_size)
+        self._rows = {}
+        for row, keyword in enumerate(self.keywords):
+            self._rows.setdefault(keyword, row)
+        
+        # n-gram 词表和逆文档频率
+        self._vocabulary = {}
+        counts = self._count_matrix(self.keywords, grow=True)
+        document_frequency = np.bincount(counts.indices, minlength=len(self._vocabulary))
+        self._idf = np.log((1 + len(self.keywords)) / (1 + document_frequency)) + 1
+        self.matrix = self._normalize(counts)
+        self._transposed = self.matrix.T.tocsr()
+        
+        # (阈值, 数量上限) -> 每个关键词的近邻列表
+        self._neighbours = {}
+    
+    def _ngrams(self, keyword):
+        """返回关键词排序词串（两端加空格）的字符 n-gram"""
+        text = f' {token_sort_key(keyword)} '
+        return [text[i:i + self.NGRAM] for i in range(len(text) - self.NGRAM + 1)]
+    
+    def _count_matrix(self, keywords, grow=False):
+        """
+        统计每个关键词的 n-gram 出现次数
+        
+        参数:
+            keywords (list): 关键词列表
+            grow (bool): 是否将新的 n-gram 加入词表，否则忽略词表之外的 n-gram
+        
+        返回:
+            scipy.sparse.csr_matrix: 关键词数 × 词表大小的计数矩阵
+        """
+        indptr = [0]
+        indices = []
+        data = []
+        vocabulary = self._vocabulary
+        for keyword in keywords:
+            for gram, count in Counter(self._ngrams(keyword)).items():
+                column = vocabulary.get(gram)
+                if column is None:
+                    if not grow:
+                        continue
+                    column = vocabulary[gram] = len(vocabulary)
+                indices.append(column)
+                data.append(count)
+            indptr.append(len(indices))
+        
+        return sparse.csr_matrix((np.array(data, dtype=np.float64),
+                                  np.array(indices, dtype=np.int64),
+                                  np.array(indptr, dtype=np.int64)),
+                                 shape=(len(keywords), len(vocabulary)))
+    
+    def _normalize(self, counts):
+        """按逆文档频率加权并将每行归一化为单位向量"""
+        weighted = counts.multiply(self._idf[np.newaxis, :]).tocsr()
+        norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+        norms[norms == 0] = 1
+        return (sparse.diags(1 / norms) @ weighted).tocsr()
+    
+    def _top_matches(self, product, threshold, limit):
+        """从相似度矩阵的每一行中选出得分达到阈值的前 limit 个 (得分, 列号)"""
+        results = []
+        for row in range(product.shape[0]):
+            start, end = product.indptr[row], product.indptr[row + 1]
+            scores = np.rint(product.data[start:end] * 100).astype(np.int64)
+            columns = product.indices[start:end]
+            keep = scores >= threshold
+            scores, columns = scores[keep], columns[keep]
+            
+            # 按得分从高到低、得分相同时按原顺序取前 limit 个
+            if len(scores) > limit:
+                kth = np.partition(scores, len(scores) - limit)[len(scores) - limit]
+                keep = scores >= kth
+                scores, columns = scores[keep], columns[keep]
+            order = np.lexsort((columns, -scores))[:limit]
+            results.append(list(zip(scores[order].tolist(), columns[order].tolist())))
+        return results
+    
+    def neighbours(self, threshold, limit=5, callback=None, cancel_event=None):
+        """
+        分块计算每个关键词的近邻
+        
+        参数:
+            threshold (int): 相似度阈值(0-100)
+            limit (int): 每个关键词最多保留的近邻数
+            callback (callable, optional): 每算完一块后以目前的近邻列表调用
+            cancel_event (threading.Event, optional): 被设置后在块之间停止
+        
+        返回:
+            list: 每个关键词的 (得分, 关键词下标) 列表，关键词总是与自身相似（得分100）。
+                  取消时只包含已算完的块，且不会被缓存
+        """
+        cache_key = (threshold, limit)
+        if cache_key in self._neighbours:
+            neighbours = self._neighbours[cache_key]
+            if callback is not None:
+                callback(neighbours)
+            return neighbours
+        
+        neighbours = []
+        for start in range(0, len(self.keywords), self.chunk_size):
+            if cancel_event is not None and cancel_event.is_set():
+                return neighbours
+            
+            product = (self.matrix[start:start + self.chunk_size] @ self._transposed).tocsr()
+            block = self._top_matches(product, threshold, limit)
+            
+            # 没有任何 n-gram 的关键词（如空串）也与自身相似
+            for row, matches in enumerate(block, start):
+                if limit > 0 and not any(column == row for _, column in matches):
+                    matches.insert(0, (100, row))
+                    del matches[limit:]
+            
+            neighbours.extend(block)
+            if callback is not None:
+                callback(neighbours)
+        
+        self._neighbours[cache_key] = neighbours
+        return neighbours
+    
+    def extract_all(self, threshold, limit=5, callback=None, cancel_event=None):
+        """
+        分块查找词表中所有关键词的相似关键词
+        
+        参数:
+            threshold (int): 相似度阈值(0-100)
+            limit (int): 返回数量上限
+            callback (callable, optional): 每算完一块后以目前的结果字典调用
+            cancel_event (threading.Event, optional): 被设置后在块之间停止
+        
+        返回:
+            dict: 关键词 -> extract 结果，取消时只包含已算完的块
+        """
+        results = {}
+        done = 0
+        
+        def collect(neighbours):
+            nonlocal done
+            for row in range(done, len(neighbours)):
+                results.setdefault(self.keywords[row], [(self.keywords[column], score)
+                                                        for score, column in neighbours[row]])
+            done = len(neighbours)
+            if callback is not None:
+                callback(results)
+        
+        if limit > 0:
+            self.neighbours(threshold, limit, collect, cancel_event)
+        return results
+    
+    def extract(self, keyword, threshold, limit=5):
+        """
+        查找与关键词相似的关键词
+        
+        参数:
+            keyword (str): 查询关键词
+            threshold (int): 相似度阈值(0-100)
+            limit (int): 返回数量上限
+        
+        返回:
+            list: (关键词, 得分) 列表，按得分从高到低、得分相同时按原顺序排列
+        """
+        if limit <= 0:
+            return []
+        
+        row = self._rows.get(keyword)
+        if row is not None:
+            matches = self.neighbours(threshold, limit)[row]
+        else:
+            # 不在词表中的关键词单独向量化
+            query = self._normalize(self._count_matrix([keyword]))
+            matches = self._top_matches((query @ self._transposed).tocsr(), threshold, limit)[0]
+        
+        return [(self.keywords[column], score) for score, column in matches]
\ No newline at end of file
@@ -0,0 +1,156 @@
+"""
+固定内存的近似关键词统计
+
+数百万条记录的语料中，完整的关键词 × 年份计数矩阵占用的内存随词表增长。这里为每个
+年份和全部年份各维护一个 Space-Saving 摘要，每个摘要最多监视 capacity 个关键词，
+内存占用与语料大小无关。
+
+Space-Saving 的计数只会高估：被监视关键词的真实次数位于 [计数-误差, 计数] 之间，
+误差不超过该摘要的最小计数，也不超过 总次数/capacity；真实次数超过 总次数/capacity
+的关键词一定被监视。未被监视的关键词真实次数位于 [0, 最小计数] 之间
+"""
+
+import heapq
+
+class SpaceSaving:
+    """Space-Saving 重频项摘要，最多监视 capacity 个项"""
+    
+    def __init__(self, capacity):
+        if capacity <= 0:
+            raise ValueError("摘要容量必须为正数")
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        self.total = 0
+        
+        # 每个被监视的项在堆中有一个条目，计数增加时不更新，弹出时发现过期再放回
+        self._heap = []
+    
+    def add(self, item, count=1):
+        """累加一个项的出现次数"""
+        self.total += count
+        if item in self.counts:
+            self.counts[item] += count
+            return
+        
+        error = 0
+        if len(self.counts) >= self.capacity:
+            # 替换计数最小的项，新项继承其计数作为误差
+            error = self._pop_minimum()
+        self.counts[item] = error + count
+        self.errors[item] = error
+        heapq.heappush(self._heap, (error + count, item))
+    
+    def _pop_minimum(self):
+        """移除计数最小的项并返回其计数"""
+        while True:
+            count, item = heapq.heappop(self._heap)
+            current = self.counts[item]
+            if current == count:
+                del self.counts[item]
+                del self.errors[item]
+                return count
+            heapq.heappush(self._heap, (current, item))
+    
+    def minimum(self):
+        """摘要未满时为0，否则为被监视项的最小计数，即未被监视项真实次数的上界"""
+        if len(self.counts) < self.capacity:
+            return 0
+        return min(self.counts.values())
+    
+    def estimate(self, item):
+        """
+        估计一个项的出现次数
+        
+        参数:
+            item: 要估计的项
+        
+        返回:
+            tuple: (上界, 误差)，真实次数位于 [上界-误差, 上界] 之间
+        """
+        if item in self.counts:
+            return self.counts[item], self.errors[item]
+        minimum = self.minimum()
+        return minimum, minimum
+    
+    def top(self, k):
+        """
+        获取计数最高的 k 个项
+        
+        返回:
+            list: (项, 上界, 误差) 列表，按上界从高到低排列
+        """
+        items = heapq.nlargest(k, self.counts.items(), key=lambda entry: entry[1])
+        return [(item, count, self.errors[item]) for item, count in items]
+
+class KeywordSketch:
+    """按年份的近似关键词统计，内存占用约为 (年份数+1) × capacity 个关键词"""
+    
+    def __init__(self, capacity=10000):
+        self.capacity = capacity
+        self.overall = SpaceSaving(capacity)
+        self.by_year = {}
+    
+    def add(self, keyword, year, count=1):
+        """累加关键词在某一年份的出现次数"""
+        self.overall.add(keyword, count)
+        summary = self.by_year.get(year)
+        if summary is None:
+            summary = self.by_year[year] = SpaceSaving(self.capacity)
+        summary.add(keyword, count)
+    
+    @property
+    def total(self):
+        """统计的关键词出现总次数"""
+        return self.overall.total
+    
+    def years(self):
+        """返回按字符串排序的年份列表"""
+        return sorted(self.by_year)
+    
+    def error_bound(self, year=None):
+        """
+        返回估计值的最大误差
+        
+        参数:
+            year (str, optional): 年份，None表示全部年份的总次数
+        
+        返回:
+            int: 任何关键词的估计次数与真实次数之差都不超过此值
+        """
+        summary = self.overall if year is None else self.by_year.get(year)
+        return 0 if summary is None else summary.minimum()
+    
+    def top(self, k):
+        """
+        获取总次数最高的 k 个关键词
+        
+        参数:
+            k (int): 关键词数
+        
+        返回:
+            list: (关键词, 上界, 误差, 是否确定) 列表。是否确定表示该关键词的次数下界
+                  不低于其余所有关键词的上界，它一定属于真实的前 k 名
+        """
+        candidates = self.overall.top(k + 1)
+        result = candidates[:k]
+        
+        # 第 k+1 名的上界，以及未被监视关键词的上界
+        rival = max(candidates[k][1] if len(candidates) > k else 0, self.overall.minimum())
+        return [(keyword, count, error, count - error >= rival) for keyword, count, error in result]
+    
+    def trend(self, keyword, years=None):
+        """
+        获取关键词每年次数的估计
+        
+        参数:
+            keyword (str): 关键词
+            years (list, optional): 年份列表，默认为全部年份
+        
+        返回:
+            list: 与年份一一对应的 (上界, 误差)
+        """
+        if years is None:
+            years = self.years()
+        return [self.by_year[year].estimate(keyword) if year in self.by_year else (0, 0)
+                for year in years]
\ No newline at end of file
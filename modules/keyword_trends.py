@@ -0,0 +1,109 @@
+"""
+关键词趋势与突发度排序
+
+关键词趋势图原先只显示总次数最多的10个关键词，它们往往是长期稳定的常见词。
+KeywordTrends 对整个关键词 × 年份计数矩阵一次性计算每个关键词的三项指标，
+全部是矩阵运算，不逐个关键词循环：
+
+- 斜率：每年次数对年份的最小二乘斜率，单位为次/年
+- 增长率：最近 recent_years 年的次数相对前一个同样长度的时间段的变化比例，
+  分子分母各加1平滑，前一时段为0的新关键词不会除以0
+- 突发度：按关键词在早期年份中所占的比例和最近几年的关键词出现总数，
+  估计最近几年的期望次数，突发度为 (实际次数-期望次数)/sqrt(期望次数+1)。
+  以比例而非次数为基准，文献总量本身的增长不会让所有关键词都显得在上升
+"""
+
+import numpy as np
+
+class KeywordTrends:
+    """关键词 × 年份计数矩阵上的趋势指标，行号与计数矩阵相同"""
+    
+    # 可用于排序的指标
+    METRICS = ('burst', 'growth', 'slope')
+    
+    def __init__(self, keyword_stats, recent_years=3):
+        """
+        参数:
+            keyword_stats (KeywordMatrix): 关键词统计
+            recent_years (int): 视为"最近"的年份数，至少保留一年作为早期年份
+        """
+        self.keyword_stats = keyword_stats
+        self.years = keyword_stats.sorted_years()
+        counts = keyword_stats.year_slice(np.arange(len(keyword_stats)), self.years).astype(np.float64)
+        self.totals = counts.sum(axis=1)
+        
+        keyword_count, year_count = counts.shape
+        self.recent_years = max(0, min(recent_years, year_count - 1))
+        window = self.recent_years
+        
+        self.slope = np.zeros(keyword_count)
+        self.growth = np.zeros(keyword_count)
+        self.burst = np.zeros(keyword_count)
+        self.recent = counts[:, year_count - window:].sum(axis=1) if window else np.zeros(keyword_count)
+        if not window:
+            return
+        
+        # 斜率：以年份数值为横坐标，年份不是整数时按顺序编号
+        try:
+            x = np.array([int(year) for year in self.years], dtype=np.float64)
+        except ValueError:
+            x = np.arange(year_count, dtype=np.float64)
+        x -= x.mean()
+        self.slope = counts @ x / (x @ x)
+        
+        # 增长率：最近一段与紧邻的前一段比较
+        previous = counts[:, max(0, year_count - 2 * window):year_count - window].sum(axis=1)
+        self.growth = (self.recent + 1) / (previous + 1) - 1
+        
+        # 突发度：早期年份的比例乘以最近几年的总次数作为期望次数
+        baseline = counts[:, :year_count - window].sum(axis=1)
+        baseline_total = baseline.sum()
+        if baseline_total:
+            expected = baseline / baseline_total * self.recent.sum()
+            self.burst = (self.recent - expected) / np.sqrt(expected + 1)
+    
+    def scores(self, metric='burst'):
+        """返回某项指标的数组"""
+        if metric not in self.METRICS:
+            raise ValueError(f"未知的趋势指标: {metric}")
+        return getattr(self, metric)
+    
+    def ranking(self, metric='burst', min_count=5, limit=None):
+        """
+        按指标从高到低排列关键词
+        
+        参数:
+            metric (str): 'burst'、'growth' 或 'slope'
+            min_count (int): 总次数低于此值的关键词不参与排序，避免偶然出现的关键词排在前面
+            limit (int, optional): 返回的关键词数上限
+        
+        返回:
+            ndarray: 行号数组，指标相同时总次数高的在前
+        """
+        scores = self.scores(metric)
+        rows = np.flatnonzero(self.totals >= min_count)
+        if limit is not None and limit < len(rows):
+            # 先用 argpartition 选出候选，再只对候选排序
+            kth = scores[rows][np.argpartition(-scores[rows], limit - 1)[limit - 1]]
+            rows = rows[scores[rows] >= kth]
+        order = rows[np.lexsort((rows, -self.totals[rows], -scores[rows]))]
+        return order if limit is None else order[:limit]
+    
+    def table(self, metric='burst', min_count=5, limit=None):
+        """
+        生成按指标排序的新兴关键词列表
+        
+        参数:
+            metric (str): 排序指标
+            min_count (int): 最小总次数
+            limit (int, optional): 关键词数上限
+        
+        返回:
+            list: (关键词, 总次数, 最近次数, 斜率, 增长率, 突发度) 列表
+        """
+        rows = self.ranking(metric, min_count, limit)
+        keywords = self.keyword_stats.keywords
+        return [(keywords[row], int(total), int(recent), slope, growth, burst)
+                for row, total, recent, slope, growth, burst in zip(
+                    rows.tolist(), self.totals[rows].tolist(), self.recent[rows].tolist(),
+                    self.slope[rows].tolist(), self.growth[rows].tolist(), self.burst[rows].tolist())]
\ No newline at end of file
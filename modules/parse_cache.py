@@ -0,0 +1,181 @@
+import os
+import json
+import pickle
+import hashlib
+
+class ParseCache:
+    """
+    解析结果的磁盘缓存
+    
+    以文件内容哈希（连同文件大小）和解析字段为键，用 pickle 协议5保存解析得到的
+    RecordStore。文件大小和修改时间未变化时直接复用记录的哈希，不再重新读取文件。
+    缓存总大小超过上限时，按最近使用时间淘汰最旧的条目
+    """
+    
+    # 缓存格式版本，解析逻辑变化时递增以使旧缓存失效
+    CACHE_VERSION = 1
+    
+    def __init__(self, cache_dir='parse_cache', max_bytes=1024 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        
+        self._index_file = os.path.join(cache_dir, 'index.json')
+        self._index = self._load_index()
+    
+    def _load_index(self):
+        """加载文件路径到 (大小, 修改时间, 哈希) 的索引"""
+        if os.path.exists(self._index_file):
+            try:
+                with open(self._index_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except:
+                return {}
+        return {}
+    
+    def _save_index(self):
+        """保存文件哈希索引"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._index_file, 'w', encoding='utf-8') as f:
+                json.dump(self._index, f, ensure_ascii=False)
+        except OSError:
+            pass
+    
+    def file_digest(self, filepath):
+        """
+        计算文件内容的哈希，大小和修改时间未变化时直接使用索引中的值
+        
+        参数:
+            filepath (str): 文件路径
+        
+        返回:
+            str: 由文件大小和内容哈希组成的摘要
+        """
+        stat = os.stat(filepath)
+        key = os.path.abspath(filepath)
+        entry = self._index.get(key)
+        if entry and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime_ns:
+            return entry['hash']
+        
+        digest = hashlib.blake2b(digest_size=20)
+        with open(filepath, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        
+        file_hash = f"{stat.st_size:x}-{digest.hexdigest()}"
+        self._index[key] = {'size': stat.st_size, 'mtime': stat.st_mtime_ns, 'hash': file_hash}
+        self._save_index()
+        return file_hash
+    
+    def _entry_path(self, filepath, fields):
+        """根据文件摘要和解析字段计算缓存条目路径"""
+        field_key = ','.join(sorted(fields)) if fields is not None else '*'
+        key = f"{self.CACHE_VERSION}|{self.file_digest(filepath)}|{field_key}"
+        name = hashlib.blake2b(key.encode('utf-8'), digest_size=20).hexdigest()
+        return os.path.join(self.cache_dir, name + '.pkl')
+    
+    def load(self, filepath, fields=None):
+        """
+        读取文件的缓存解析结果
+        
+        参数:
+            filepath (str): 文件路径
+            fields (set, optional): 解析时保留的字段标签
+        
+        返回:
+            RecordStore: 缓存的记录，未命中时返回None
+        """
+        try:
+            entry_path = self._entry_path(filepath, fields)
+            with open(entry_path, 'rb') as f:
+                records = pickle.load(f)
+            # 更新访问时间，供淘汰策略使用
+            os.utime(entry_path)
+        except Exception:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        return records
+    
+    def store(self, filepath, fields, records):
+        """
+        保存文件的解析结果
+        
+        参数:
+            filepath (str): 文件路径
+            fields (set): 解析时保留的字段标签，None表示全部字段
+            records (RecordStore): 该文件解析得到的记录
+        """
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            entry_path = self._entry_path(filepath, fields)
+            temp_path = entry_path + '.tmp'
+            with open(temp_path, 'wb') as f:
+                pickle.dump(records, f, protocol=5)
+            os.replace(temp_path, entry_path)
+        except Exception:
+            return
+        
+        self.evict()
+    
+    def _entries(self):
+        """列出所有缓存条目的 (最近使用时间, 大小, 路径)"""
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.pkl'):
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+    
+    def size(self):
+        """返回缓存占用的总字节数"""
+        return sum(size for _, size, _ in self._entries())
+    
+    def evict(self):
+        """缓存超过大小上限时，删除最久未使用的条目"""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+    
+    def clear(self):
+        """
+        清空缓存
+        
+        返回:
+            int: 释放的字节数
+        """
+        freed = 0
+        for _, size, path in self._entries():
+            try:
+                os.remove(path)
+                freed += size
+            except OSError:
+                pass
+        
+        self._index = {}
+        if os.path.exists(self._index_file):
+            try:
+                os.remove(self._index_file)
+            except OSError:
+                pass
+        
+        self.hits = 0
+        self.misses = 0
+        return freed
\ No newline at end of file
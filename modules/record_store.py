@@ -0,0 +1,282 @@
+from array import array
+from collections.abc import MutableMapping
+
+class RecordView(MutableMapping):
+    """记录存储中单条记录的字典视图，读取时才从共享文本缓冲区解码字段值"""
+    
+    __slots__ = ('_store', '_row')
+    
+    def __init__(self, store, row):
+        self._store = store
+        self._row = row
+    
+    def __getitem__(self, tag):
+        extra = self._store._extra.get(self._row)
+        if extra is not None and tag in extra:
+            return extra[tag]
+        
+        value = self._store.get_value(self._row, tag)
+        if value is None:
+            raise KeyError(tag)
+        return value
+    
+    def __contains__(self, tag):
+        extra = self._store._extra.get(self._row)
+        if extra is not None and tag in extra:
+            return True
+        return self._store.has_value(self._row, tag)
+    
+    def __setitem__(self, tag, value):
+        # 派生字段（如 'Keywords'）保存在附加字典中，不写入文本缓冲区
+        self._store._extra.setdefault(self._row, {})[tag] = value
+    
+    def __delitem__(self, tag):
+        extra = self._store._extra.get(self._row)
+        if extra is None or tag not in extra:
+            raise KeyError(tag)
+        del extra[tag]
+    
+    def __iter__(self):
+        extra = self._store._extra.get(self._row, {})
+        for tag in self._store.row_tags(self._row):
+            if tag not in extra:
+                yield tag
+        yield from extra
+    
+    def __len__(self):
+        return sum(1 for _ in self)
+    
+    def __repr__(self):
+        return f"RecordView({dict(self)!r})"
+
+class RecordStore:
+    """
+    列式记录存储，替代每篇文献一个字典的列表
+    
+    每个字段标签映射为整数编号，每个标签一列，保存字段值在共享UTF-8文本缓冲区中的
+    起始偏移和长度（缺失为 -1），出版年份另存为整数列。通过下标或迭代得到的
+    RecordView 与原来的记录字典用法相同，分析模块可以逐步迁移到按列访问
+    """
+    
+    def __init__(self):
+        self.tag_ids = {}
+        self.tags = []
+        self.years = array('i')
+        
+        self._buffer = bytearray()
+        self._starts = []
+        self._lengths = []
+        self._row_offsets = array('q')
+        self._extra = {}
+    
+    def __len__(self):
+        return len(self._row_offsets)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [RecordView(self, row) for row in range(*index.indices(len(self)))]
+        
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("记录下标超出范围")
+        return RecordView(self, index)
+    
+    def __iter__(self):
+        for row in range(len(self)):
+            yield RecordView(self, row)
+    
+    def _tag_id(self, tag):
+        """获取标签编号，新标签会创建一列并为已有记录补齐缺失值"""
+        tag_id = self.tag_ids.get(tag)
+        if tag_id is None:
+            tag_id = len(self.tags)
+            self.tag_ids[tag] = tag_id
+            self.tags.append(tag)
+            self._starts.append(array('q', [-1]) * len(self))
+            self._lengths.append(array('i', [0]) * len(self))
+        return tag_id
+    
+    def append(self, record):
+        """
+        追加一条记录
+        
+        参数:
+            record (dict): 记录字段字典
+        """
+        row = len(self)
+        self._row_offsets.append(len(self._buffer))
+        for starts, lengths in zip(self._starts, self._lengths):
+            starts.append(-1)
+            lengths.append(0)
+        
+        for tag, value in record.items():
+            if not isinstance(value, str):
+                # 非文本的派生字段不进入文本缓冲区
+                self._extra.setdefault(row, {})[tag] = value
+                continue
+            
+            tag_id = self._tag_id(tag)
+            data = value.encode('utf-8')
+            self._starts[tag_id][row] = len(self._buffer)
+            self._lengths[tag_id][row] = len(data)
+            self._buffer += data
+        
+        self.years.append(self._parse_year(record.get('PY')))
+    
+    def extend(self, records):
+        """
+        追加多条记录
+        
+        参数:
+            records (iterable): 记录字典的可迭代对象，或另一个 RecordStore
+        """
+        if isinstance(records, RecordStore):
+            self._extend_store(records)
+        else:
+            for record in records:
+                self.append(record)
+    
+    def _extend_store(self, other):
+        """按列合并另一个记录存储"""
+        row_base = len(self)
+        buffer_base = len(self._buffer)
+        count = len(other)
+        
+        for tag, other_id in other.tag_ids.items():
+            tag_id = self._tag_id(tag)
+            self._starts[tag_id].extend(
+                start + buffer_base if start >= 0 else -1 for start in other._starts[other_id])
+            self._lengths[tag_id].extend(other._lengths[other_id])
+        
+        # 对方没有的列补齐缺失值
+        for starts, lengths in zip(self._starts, self._lengths):
+            if len(starts) < row_base + count:
+                starts.extend(array('q', [-1]) * count)
+                lengths.extend(array('i', [0]) * count)
+        
+        self._row_offsets.extend(offset + buffer_base for offset in other._row_offsets)
+        self.years.extend(other.years)
+        self._buffer += other._buffer
+        for row, extra in other._extra.items():
+            self._extra[row + row_base] = dict(extra)
+    
+    def truncate(self, count):
+        """
+        丢弃第 count 条之后的所有记录
+        
+        参数:
+            count (int): 保留的记录数
+        """
+        if count >= len(self):
+            return
+        
+        buffer_end = self._row_offsets[count]
+        del self._buffer[buffer_end:]
+        del self._row_offsets[count:]
+        del self.years[count:]
+        for starts, lengths in zip(self._starts, self._lengths):
+            del starts[count:]
+            del lengths[count:]
+        for row in [row for row in self._extra if row >= count]:
+            del self._extra[row]
+    
+    def get_value(self, row, tag):
+        """
+        读取一条记录的字段值
+        
+        参数:
+            row (int): 记录下标
+            tag (str): 两字母字段标签
+        
+        返回:
+            str: 字段值，缺失时返回None
+        """
+        tag_id = self.tag_ids.get(tag)
+        if tag_id is None:
+            return None
+        
+        start = self._starts[tag_id][row]
+        if start < 0:
+            return None
+        return self._buffer[start:start + self._lengths[tag_id][row]].decode('utf-8')
+    
+    def has_value(self, row, tag):
+        """判断一条记录是否包含某个字段"""
+        tag_id = self.tag_ids.get(tag)
+        return tag_id is not None and self._starts[tag_id][row] >= 0
+    
+    def row_tags(self, row):
+        """返回一条记录中存在的字段标签"""
+        return [tag for tag, starts in zip(self.tags, self._starts) if starts[row] >= 0]
+    
+    def column(self, tag):
+        """
+        按顺序产出某个字段在所有记录中的值
+        
+        参数:
+            tag (str): 两字母字段标签
+        
+        产出:
+            str: 字段值，缺失时为None
+        """
+        tag_id = self.tag_ids.get(tag)
+        if tag_id is None:
+            for _ in range(len(self)):
+                yield None
+            return
+        
+        buffer = self._buffer
+        for start, length in zip(self._starts[tag_id], self._lengths[tag_id]):
+            yield buffer[start:start + length].decode('utf-8') if start >= 0 else None
+    
+    def column_slices(self, tags, start, stop):
+        """
+        取出区间内记录的若干字段的原始数据，用于交给子进程解码
+        
+        区间内记录的文本在缓冲区中是连续的，只需复制一段字节和各列的偏移、长度数组，
+        不在当前进程中逐条解码
+        
+        参数:
+            tags (iterable): 字段标签
+            start (int): 起始记录下标
+            stop (int): 结束记录下标（不含）
+        
+        返回:
+            tuple: (文本字节, 字节的起始偏移, {标签: (偏移数组, 长度数组)})，偏移相对于整个缓冲区，
+                   缺失值的偏移为 -1，不存在的标签不出现在字典中
+        """
+        base = self._row_offsets[start] if start < len(self) else len(self._buffer)
+        end = self._row_offsets[stop] if stop < len(self) else len(self._buffer)
+        columns = {}
+        for tag in tags:
+            tag_id = self.tag_ids.get(tag)
+            if tag_id is not None:
+                columns[tag] = (self._starts[tag_id][start:stop], self._lengths[tag_id][start:stop])
+        return bytes(self._buffer[base:end]), base, columns
+    
+    def set_extra(self, tag, rows, values):
+        """
+        批量设置派生字段，与逐条执行 store[row][tag] = value 相同
+        
+        参数:
+            tag (str): 字段名，如 'Keywords'
+            rows (iterable): 记录下标
+            values (iterable): 与下标一一对应的值
+        """
+        extra = self._extra
+        for row, value in zip(rows, values):
+            extra.setdefault(row, {})[tag] = value
+    
+    def clear(self):
+        """清空所有记录"""
+        self.__init__()
+    
+    @staticmethod
+    def _parse_year(value):
+        """将 'PY' 字段转换为整数年份，无法识别时为0"""
+        if value:
+            value = value.strip()
+            if value[:4].isdigit():
+                return int(value[:4])
+        return 0
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""
+Web of Science 制表符分隔格式（Tab-delimited UTF-8）的读取器
+
+此格式的第一行是以制表符分隔的字段标签（PT、AU、TI……），之后每行是一条记录。
+由 pandas 的C语言CSV读取器按块切分字段，产出与标记格式分词器相同的记录字典，
+下游的去重、列式存储和分析模块无需区分两种格式
+"""
+
+import csv
+
+# UTF-8 字节顺序标记，Web of Science 导出的制表符分隔文件通常以它开头
+_UTF8_BOM = b'\xef\xbb\xbf'
+
+def is_tab_delimited(head):
+    """
+    根据文件开头的字节判断是否为制表符分隔格式
+    
+    参数:
+        head (bytes): 文件开头的若干字节
+    
+    返回:
+        bool: 首行以 'PT' 加制表符开头时为True
+    """
+    if head.startswith(_UTF8_BOM):
+        head = head[len(_UTF8_BOM):]
+    return head.startswith(b'PT\t')
+
+def read_tab_delimited(stream, fields=None, progress=None, chunksize=20000):
+    """
+    从制表符分隔格式的数据流中逐条读取记录
+    
+    参数:
+        stream: 以二进制模式打开的文件或解压数据流
+        fields (set, optional): 需要保留的字段标签，None表示保留全部字段
+        progress (callable, optional): 每读完一块后调用，用于报告进度
+        chunksize (int): 每块读取的记录数
+    
+    产出:
+        dict: 单条记录的字段字典，空字段不出现在字典中
+    """
+    # pandas 只在读取制表符分隔文件时导入，解析标记格式的子进程无需加载
+    import pandas as pd
+    
+    usecols = None if fields is None else (lambda column: column.strip() in fields)
+    reader = pd.read_csv(stream, sep='\t', dtype=str, encoding='utf-8-sig',
+                         quoting=csv.QUOTE_NONE, keep_default_na=False, na_filter=False,
+                         index_col=False, usecols=usecols, chunksize=chunksize)
+    
+    for chunk in reader:
+        tags = [column.strip() for column in chunk.columns]
+        columns = [chunk[column].tolist() for column in chunk.columns]
+        for values in zip(*columns):
+            yield {tag: value for tag, value in zip(tags, values) if value}
+        
+        if progress is not None:
+            progress()
\ No newline at end of file
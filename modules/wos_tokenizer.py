@@ -0,0 +1,91 @@
+"""
+Web of Science 标记格式（Plain Text）的单遍字段分词器
+
+导出文件中每行的前两列是字段标签，第三列是分隔符，字段值从第四列开始；
+字段的延续行以空格开头。因此只需检查行首字符即可区分新字段和延续行，
+无需对每一行做正则匹配。延续行先收集到列表中，字段结束时一次性拼接和解码。
+任何记录类型（期刊J、图书B、丛书S、会议C等）的 'PT' 行都开始一条新记录。
+指定需要的字段后，其余字段的行（如 CR、AB）直接跳过，不拼接字符串也不写入字典
+"""
+
+# 行首为这些字节时不是字段标签行：空格或制表符开头的延续行，以及空行
+_NON_TAG_BYTES = (0x20, 0x09, 0x0d, 0x0a)
+
+def tokenize_records(lines, fields=None, complete_only=False):
+    """
+    从导出文件的字节行中逐条切分记录
+    
+    参数:
+        lines (iterable): 原始字节行（可带行尾换行符）
+        fields (set, optional): 需要保留的字段标签，None表示保留全部字段
+        complete_only (bool): 为True时不产出末尾缺少 'ER' 行的最后一条记录，
+            用于读到可能仍在写入的文件末尾时
+    
+    产出:
+        dict: 单条记录的字段字典，包括记录类型 'PT'
+    """
+    wanted = None if fields is None else {field.encode('ascii') for field in fields}
+    tag_names = {}
+    record = None
+    current_tag = None
+    parts = None
+    
+    for line in lines:
+        if not line or line[0] in _NON_TAG_BYTES:
+            # 字段的延续行或空行
+            if parts is not None:
+                value = line.strip()
+                if value:
+                    parts.append(value)
+            continue
+        
+        tag = line[:2]
+        
+        # 'PT' 行开始一条新记录
+        if tag == b'PT':
+            if record is not None:
+                if parts is not None:
+                    record[current_tag] = b' '.join(parts).decode('utf-8')
+                yield record
+            record = {}
+            if wanted is None or tag in wanted:
+                current_tag = 'PT'
+                parts = [line[3:].strip()]
+            else:
+                current_tag = None
+                parts = None
+            continue
+        
+        # 记录之外的行（FN、VR、EF等文件头尾）直接忽略
+        if record is None:
+            continue
+        
+        # 完成上一个字段
+        if parts is not None:
+            record[current_tag] = b' '.join(parts).decode('utf-8')
+        
+        # 'ER' 行结束当前记录
+        if tag == b'ER' and not line[2:].strip():
+            yield record
+            record = None
+            current_tag = None
+            parts = None
+            continue
+        
+        # 不需要的字段及其延续行全部跳过
+        if wanted is not None and tag not in wanted:
+            current_tag = None
+            parts = None
+            continue
+        
+        # 新字段
+        current_tag = tag_names.get(tag)
+        if current_tag is None:
+            current_tag = tag_names[tag] = tag.decode('ascii', 'replace')
+        parts = [line[3:].strip()]
+    
+    # 文件末尾缺少 'ER' 的最后一条记录
+    if record is not None and not complete_only:
+        if parts is not None:
+            record[current_tag] = b' '.join(parts).decode('utf-8')
+        yield record
\ No newline at end of file
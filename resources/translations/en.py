@@ -4,6 +4,7 @@
 COMMON = {
     "language": "Language:",
     "browse": "Browse",
+    "browse_folder": "Import Folder",
     "close": "Close",
     "success": "Success",
     "error": "Error",
@@ -22,15 +23,21 @@ MAIN = {
     "app_title": "Web of Science Literature Analyzer",
     "file_select": "No files selected",
     "reset_all": "Reset All Data",
+    "clear_cache": "Clear Parse Cache",
     "debug_info": "View Debug Info",
     "tab_keywords": "Keyword Analysis",
     "tab_countries": "Country Analysis",
     "import_complete": "Import Complete",
     "import_success": "Successfully imported {0} records.",
+    "duplicates_skipped": "Skipped {0} duplicate records already imported.",
     "reset_complete": "Reset Complete",
     "reset_msg": "All data has been cleared.",
+    "cache_cleared": "Parse cache cleared, {0:.1f} MB freed.",
     "open_wos_files": "Open Web of Science Files",
+    "open_wos_folder": "Select Folder with Web of Science Files",
+    "no_files_in_folder": "No Web of Science exports or archives ({0}) were found in the selected folder.",
     "text_files": "Text Files",
+    "wos_files": "Web of Science Exports",
     "selected_files": "Selected files:"
 }
 
@@ -40,10 +47,24 @@ KEYWORD = {
     "keyword_trend": "Keyword Trends",
     "similar_groups": "Similar Keyword Groups",
     "similarity_threshold": "Similarity Threshold:",
+    "similarity_method": "Method:",
+    "method_fuzzy": "Fuzzy matching",
+    "method_tfidf": "TF-IDF cosine",
+    "method_cluster": "Incremental clustering",
     "export": "Export",
     "export_excel": "Export to Excel",
     "export_graph": "Export to Graph",
+    "export_network": "Export Co-occurrence Network",
+    "emerging_keywords": "Emerging Keywords",
+    "plot_mode": "Show:",
+    "plot_top": "Most frequent",
+    "plot_emerging": "Emerging",
+    "recent_count": "Last {0} years",
+    "slope": "Slope",
+    "growth_rate": "Growth",
+    "burst_score": "Burst",
     "group_keywords": "Group Keywords",
+    "cancel_grouping": "Cancel",
     "keyword": "Keyword",
     "count": "Count"
 }
@@ -4,6 +4,7 @@
 COMMON = {
     "language": "Язык:",
     "browse": "Обзор",
+    "browse_folder": "Импорт папки",
     "close": "Закрыть",
     "success": "Успех",
     "error": "Ошибка",
@@ -22,15 +23,21 @@ MAIN = {
     "app_title": "Инструмент анализа литературы Web of Science",
     "file_select": "Файлы не выбраны",
     "reset_all": "Сбросить все данные",
+    "clear_cache": "Очистить кэш разбора",
     "debug_info": "Просмотр отладочной информации",
     "tab_keywords": "Анализ ключевых слов",
     "tab_countries": "Анализ по странам",
     "import_complete": "Импорт завершен",
     "import_success": "Успешно импортировано {0} записей.",
+    "duplicates_skipped": "Пропущено повторяющихся записей: {0}.",
     "reset_complete": "Сброс завершен",
     "reset_msg": "Все данные очищены.",
+    "cache_cleared": "Кэш разбора очищен, освобождено {0:.1f} МБ.",
     "open_wos_files": "Открыть файлы Web of Science",
+    "open_wos_folder": "Выберите папку с файлами Web of Science",
+    "no_files_in_folder": "В выбранной папке не найдено файлов экспорта Web of Science или архивов ({0}).",
     "text_files": "Текстовые файлы", 
+    "wos_files": "Файлы экспорта Web of Science",
     "selected_files": "Выбранные файлы:"
 }
 
@@ -40,10 +47,24 @@ KEYWORD = {
     "keyword_trend": "Тенденции ключевых слов",
     "similar_groups": "Группы похожих ключевых слов",
     "similarity_threshold": "Порог сходства:",
+    "similarity_method": "Метод:",
+    "method_fuzzy": "Нечёткое сравнение",
+    "method_tfidf": "Косинус TF-IDF",
+    "method_cluster": "Инкрементная кластеризация",
     "export": "Экспорт",
     "export_excel": "Экспорт в Excel",
     "export_graph": "Экспорт графика",
+    "export_network": "Экспорт сети совместной встречаемости",
+    "emerging_keywords": "Новые ключевые слова",
+    "plot_mode": "Показать:",
+    "plot_top": "Самые частые",
+    "plot_emerging": "Растущие",
+    "recent_count": "За последние годы ({0})",
+    "slope": "Наклон",
+    "growth_rate": "Рост",
+    "burst_score": "Всплеск",
     "group_keywords": "Группировать ключевые слова",
+    "cancel_grouping": "Отмена",
     "keyword": "Ключевое слово",
     "count": "Количество"
 }
@@ -4,6 +4,7 @@
 COMMON = {
     "language": "语言:",
     "browse": "浏览",
+    "browse_folder": "导入文件夹",
     "close": "关闭",
     "success": "成功",
     "error": "错误",
@@ -22,15 +23,21 @@ MAIN = {
     "app_title": "Web of Science 文献分析工具",
     "file_select": "未选择文件",
     "reset_all": "重置所有数据",
+    "clear_cache": "清空解析缓存",
     "debug_info": "查看调试信息",
     "tab_keywords": "关键词分析",
     "tab_countries": "国家分析",
     "import_complete": "导入完成",
     "import_success": "成功导入 {0} 条记录。",
+    "duplicates_skipped": "已跳过 {0} 条重复记录。",
     "reset_complete": "重置完成",
     "reset_msg": "所有数据已清除。",
+    "cache_cleared": "解析缓存已清空，释放 {0:.1f} MB。",
     "open_wos_files": "打开Web of Science文件",
+    "open_wos_folder": "选择包含Web of Science文件的文件夹",
+    "no_files_in_folder": "所选文件夹中没有找到Web of Science导出文件或压缩包（{0}）。",
     "text_files": "文本文件",
+    "wos_files": "Web of Science 导出文件",
     "selected_files": "已选择文件:"
 }
 
@@ -40,10 +47,24 @@ KEYWORD = {
     "keyword_trend": "Keyword Trend",
     "similar_groups": "相似关键词分组",
     "similarity_threshold": "相似度阈值:",
+    "similarity_method": "相似度算法:",
+    "method_fuzzy": "模糊匹配",
+    "method_tfidf": "TF-IDF 余弦",
+    "method_cluster": "增量聚类",
     "export": "导出",
     "export_excel": "导出为Excel表格",
     "export_graph": "导出图片",
+    "export_network": "导出共现网络",
+    "emerging_keywords": "新兴关键词",
+    "plot_mode": "显示:",
+    "plot_top": "出现最多",
+    "plot_emerging": "新兴",
+    "recent_count": "最近{0}年",
+    "slope": "斜率",
+    "growth_rate": "增长率",
+    "burst_score": "突发度",
     "group_keywords": "分组关键词",
+    "cancel_grouping": "取消",
     "keyword": "关键词",
     "count": "Publication Count"
 }
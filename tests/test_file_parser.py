@@ -0,0 +1,40 @@
+"""WoSFileParser 续读追加内容的测试"""
+
+from modules.file_parser import WoSFileParser
+
+HEADER = "FN Clarivate Analytics Web of Science\nVR 1.0\n"
+
+def record(accession, title, year="2020", keywords="alpha; beta"):
+    return f"PT J\nTI {title}\nDE {keywords}\nPY {year}\nUT {accession}\nER\n\n"
+
+def test_append_after_partial_record(tmp_path):
+    path = tmp_path / "savedrecs.txt"
+    path.write_text(HEADER + record("WOS:111", "First") + "PT J\nTI Second\nDE gamma\n")
+    
+    parser = WoSFileParser()
+    assert parser.parse_file(str(path)) == 1
+    
+    # 写完未完成的记录并追加一条新记录
+    with open(path, "a") as file:
+        file.write("PY 2021\nUT WOS:777\nER\n\n" + record("WOS:888", "Third") + "EF\n")
+    assert parser.parse_file(str(path)) == 2
+    
+    records = list(parser.get_records())
+    assert [r["UT"] for r in records] == ["WOS:111", "WOS:777", "WOS:888"]
+    assert records[1] == {"PT": "J", "TI": "Second", "DE": "gamma", "PY": "2021", "UT": "WOS:777"}
+    
+    # 文件没有变化时不再解析
+    assert parser.parse_file(str(path)) == 0
+    assert len(parser.get_records()) == 3
+
+def test_append_after_partial_record_parse_files(tmp_path):
+    path = tmp_path / "savedrecs.txt"
+    path.write_text(HEADER + record("WOS:111", "First") + "PT J\nTI Second\n")
+    
+    parser = WoSFileParser()
+    assert parser.parse_files([str(path)], max_workers=1) == 1
+    
+    with open(path, "a") as file:
+        file.write("PY 2021\nUT WOS:777\nER\n\nEF\n")
+    assert parser.parse_files([str(path)], max_workers=1) == 1
+    assert [r["UT"] for r in parser.get_records()] == ["WOS:111", "WOS:777"]
\ No newline at end of file
@@ -0,0 +1,28 @@
+"""KeywordAnalyzer 近似关键词统计的测试"""
+
+from modules.file_parser import WoSFileParser
+from modules.keyword_analyzer import KeywordAnalyzer
+
+def record(accession, year, keywords):
+    return f"PT J\nTI Title {accession}\nDE {keywords}\nPY {year}\nUT {accession}\nER\n\n"
+
+def test_sketch_files_skips_duplicate_records(tmp_path, monkeypatch):
+    # 规范化查找表写在临时目录中
+    monkeypatch.chdir(tmp_path)
+    first = tmp_path / "first.txt"
+    second = tmp_path / "second.txt"
+    first.write_text(record("WOS:1", 2020, "soil erosion; runoff")
+                     + record("WOS:2", 2021, "soil erosion; climate change") + "EF\n")
+    second.write_text(record("WOS:2", 2021, "soil erosion; climate change")
+                      + record("WOS:3", 2021, "runoff") + "EF\n")
+    paths = [str(first), str(second), str(first)]
+    
+    parser = WoSFileParser()
+    parser.parse_files(paths, max_workers=1)
+    stats = KeywordAnalyzer().update_from_records(parser.get_records())
+    
+    sketch = KeywordAnalyzer().sketch_files(WoSFileParser(), paths)
+    assert sketch.total == sum(stats.total(keyword) for keyword in stats) == 5
+    for keyword in stats:
+        assert sketch.overall.estimate(keyword) == (stats.total(keyword), 0)
+    assert sketch.trend("soil erosion", ["2020", "2021"]) == [(1, 0), (1, 0)]
\ No newline at end of file
@@ -0,0 +1,32 @@
+"""KeywordClusterer 增量聚类的测试"""
+
+from itertools import permutations
+
+from modules.keyword_similarity import KeywordClusterer
+
+# A~B、B~C 的得分达到80，A 与 C 不相似
+A, B, C = "soil erosion", "soil erosion rate", "soil erosion rate model"
+
+def group_of(groups, keyword):
+    return next(group for group in groups if keyword in group)
+
+def test_similar_chain_is_not_merged():
+    for order in permutations((A, B, C)):
+        clusterer = KeywordClusterer(80)
+        clusterer.add(order)
+        groups = clusterer.groups()
+        assert C not in group_of(groups, A), order
+        assert sorted(map(len, groups)) == [1, 2], order
+
+def test_similar_chain_is_not_merged_across_imports():
+    clusterer = KeywordClusterer(80)
+    clusterer.add([A, C])
+    clusterer.add([B])
+    
+    # B 与 C 的得分更高
+    assert clusterer.groups() == [[A], [C, B]]
+
+def test_identical_sorted_keys_share_a_group():
+    clusterer = KeywordClusterer(80)
+    clusterer.add(["soil erosion", "Erosion, soil", "vegetation cover"])
+    assert clusterer.groups() == [["soil erosion", "Erosion, soil"], ["vegetation cover"]]
\ No newline at end of file